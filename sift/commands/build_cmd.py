@@ -1,16 +1,32 @@
 """Build commands: generate outputs from completed sessions - thin CLI wrappers."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import typer
 from rich.panel import Panel
 
 from sift.completions import complete_format, complete_session_name
-from sift.core.build_service import BuildService
 from sift.error_handler import handle_errors
 from sift.ui import console
 
+if TYPE_CHECKING:
+    from sift.core.build_service import BuildService
+
 app = typer.Typer(no_args_is_help=True)
 
-_svc = BuildService()
+_svc: BuildService | None = None
+
+
+def _get_svc() -> BuildService:
+    """Get or create the BuildService shared by the build commands."""
+    global _svc
+    if _svc is None:
+        from sift.core.build_service import BuildService
+
+        _svc = BuildService()
+    return _svc
 
 
 @app.command("generate")
@@ -26,7 +42,7 @@ def generate(
     ),
 ):
     """Generate outputs from a session's extracted data."""
-    result = _svc.generate_outputs(session, format)
+    result = _get_svc().generate_outputs(session, format)
 
     console.print("\n[green bold]Outputs generated:[/green bold]\n")
     for label, path in result.generated_files:
@@ -42,7 +58,7 @@ def ai_summary(
 ):
     """Generate an AI-powered narrative summary of the session."""
     with console.status("[bold]Generating AI summary...[/bold]"):
-        summary, summary_path = _svc.generate_summary(session)
+        summary, summary_path = _get_svc().generate_summary(session)
 
     console.print(Panel(summary, title="AI Summary", border_style="green"))
     console.print(f"\n[dim]Saved to: {summary_path}[/dim]")
@@ -80,9 +80,8 @@ def demo(
     from sift.core.session_service import SessionService
     from sift.models import SESSIONS_DIR, Session
 
-    console.print()
     console.print(
-        "[bold cyan]Welcome to the sift demo![/bold cyan]\n"
+        "\n[bold cyan]Welcome to the sift demo![/bold cyan]\n"
         "[dim]This walks through a complete session lifecycle with sample data.\n"
         "No API key is needed - extraction data is pre-generated.[/dim]\n"
     )
@@ -115,32 +114,38 @@ def demo(
     step_header(2, 5, "Capture Phase 1: Describe", "Feeding in sample text")
 
     session = Session.load(DEMO_SESSION_NAME)
-    _write_transcript(session, "describe", DEMO_TEXT_PHASE_1)
-    console.print(f"  Captured {len(DEMO_TEXT_PHASE_1)} characters of sample text")
+    # Steps 2-4 only touch this session, so its state is written once at the end
+    with session.transaction():
+        _write_transcript(session, "describe", DEMO_TEXT_PHASE_1)
+        console.print(f"  Captured {len(DEMO_TEXT_PHASE_1)} characters of sample text")
+
+        # Step 3: Extract phase 1 (pre-generated)
+        section_divider()
+        step_header(3, 5, "Extract Phase 1", "AI extraction (pre-generated for demo)")
+
+        _write_extraction(session, "describe", DEMO_EXTRACTION_PHASE_1)
+
+        lines = ["  Extracted fields:"]
+        for key, value in DEMO_EXTRACTION_PHASE_1.items():
+            if isinstance(value, list):
+                lines.append(f"    [cyan]{key}[/cyan]: {len(value)} items")
+            else:
+                text = str(value)
+                preview = text[:60] + "..." if len(text) > 60 else text
+                lines.append(f"    [cyan]{key}[/cyan]: {preview}")
+        console.print("\n".join(lines))
+
+        # Step 4: Capture + extract phase 2
+        section_divider()
+        step_header(4, 5, "Phase 2: Reflect and Add", "Capture + extract in one step")
+
+        _write_transcript(session, "reflect", DEMO_TEXT_PHASE_2)
+        _write_extraction(session, "reflect", DEMO_EXTRACTION_PHASE_2)
 
-    # Step 3: Extract phase 1 (pre-generated)
-    section_divider()
-    step_header(3, 5, "Extract Phase 1", "AI extraction (pre-generated for demo)")
-
-    _write_extraction(session, "describe", DEMO_EXTRACTION_PHASE_1)
-
-    console.print("  Extracted fields:")
-    for key, value in DEMO_EXTRACTION_PHASE_1.items():
-        if isinstance(value, list):
-            console.print(f"    [cyan]{key}[/cyan]: {len(value)} items")
-        else:
-            preview = str(value)[:60] + "..." if len(str(value)) > 60 else str(value)
-            console.print(f"    [cyan]{key}[/cyan]: {preview}")
-
-    # Step 4: Capture + extract phase 2
-    section_divider()
-    step_header(4, 5, "Phase 2: Reflect and Add", "Capture + extract in one step")
-
-    _write_transcript(session, "reflect", DEMO_TEXT_PHASE_2)
-    _write_extraction(session, "reflect", DEMO_EXTRACTION_PHASE_2)
-
-    console.print(f"  Captured {len(DEMO_TEXT_PHASE_2)} characters")
-    console.print(f"  Extracted {len(DEMO_EXTRACTION_PHASE_2)} fields")
+        console.print(
+            f"  Captured {len(DEMO_TEXT_PHASE_2)} characters\n"
+            f"  Extracted {len(DEMO_EXTRACTION_PHASE_2)} fields"
+        )
 
     # Step 5: Build outputs
     section_divider()
@@ -149,9 +154,11 @@ def demo(
     build_svc = BuildService()
     build_result = build_svc.generate_outputs(DEMO_SESSION_NAME, "all")
 
-    console.print("  Generated files:")
-    for label, path in build_result.generated_files:
-        console.print(f"    [green]{label}[/green]: {path}")
+    lines = ["  Generated files:"]
+    lines.extend(
+        f"    [green]{label}[/green]: {path}" for label, path in build_result.generated_files
+    )
+    console.print("\n".join(lines))
 
     # Summary
     section_divider()
@@ -186,13 +193,12 @@ def _write_transcript(session: Session, phase_id: str, text: str) -> None:
 
     phase_dir = session.phase_dir(phase_id)
     transcript_path = phase_dir / "transcript.txt"
-    transcript_path.write_text(text)
+    transcript_path.write_bytes(text.encode("utf-8"))
 
     ps = session.phases[phase_id]
     ps.status = "transcribed"
     ps.transcript_file = "transcript.txt"
-    ps.captured_at = datetime.now().isoformat()
-    ps.transcribed_at = datetime.now().isoformat()
+    ps.captured_at = ps.transcribed_at = datetime.now().isoformat()
     session.save()
 
 
@@ -204,8 +210,8 @@ def _write_extraction(session: Session, phase_id: str, data: dict) -> None:
 
     phase_dir = session.phase_dir(phase_id)
     extracted_path = phase_dir / "extracted.yaml"
-    with open(extracted_path, "w") as f:
-        _yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    yaml_bytes = _yaml.dump(data, default_flow_style=False, sort_keys=False).encode("utf-8")
+    extracted_path.write_bytes(yaml_bytes)
 
     ps = session.phases[phase_id]
     ps.status = "extracted"
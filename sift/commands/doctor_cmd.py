@@ -6,7 +6,6 @@ import logging
 import sys
 
 import typer
-from rich.table import Table
 
 from sift.ui import ICONS, console
 
@@ -19,6 +18,8 @@ def doctor(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed diagnostics"),
 ):
     """Run diagnostic checks on sift environment."""
+    from rich.table import Table
+
     checks: list[tuple[str, bool, str]] = []
 
     # 1. Python version
@@ -62,11 +63,11 @@ def doctor(
     checks.append(("Sessions directory", sess_ok, str(sessions_dir)))
 
     # 5. Provider availability
-    from sift.core.secrets import list_stored_providers
+    from sift.core.secrets import KEY_READY_STATUSES, list_stored_providers
 
     key_status = list_stored_providers()
     for provider_name, status in key_status.items():
-        has_key = status in ("env", "keyring", "file", "no key needed")
+        has_key = status in KEY_READY_STATUSES
         detail = f"API key: {status}"
         if has_key and verbose:
             try:
@@ -3,14 +3,30 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
 from sift.completions import complete_session_name, complete_template_name
 from sift.ui import console
 
+if TYPE_CHECKING:
+    from sift.core.export_service import ExportService
+
 app = typer.Typer(no_args_is_help=True)
 
+_export_service: ExportService | None = None
+
+
+def _get_export_service() -> ExportService:
+    """Get or create the ExportService shared by the export/import commands."""
+    global _export_service
+    if _export_service is None:
+        from sift.core.export_service import ExportService
+
+        _export_service = ExportService()
+    return _export_service
+
 
 @app.command("session")
 def export_session(
@@ -24,13 +40,12 @@ def export_session(
     ),
 ):
     """Export a session as a portable archive."""
-    from sift.core.export_service import ExportService
     from sift.errors import SiftError
 
     output_dir = Path(output) if output else None
 
     try:
-        svc = ExportService()
+        svc = _get_export_service()
         result = svc.export_session(
             session, format=format, output_dir=output_dir, include_audio=include_audio
         )
@@ -52,13 +67,12 @@ def export_template(
     output: str = typer.Option(None, "--output", "-o", help="Output file path"),
 ):
     """Export a template as a YAML file."""
-    from sift.core.export_service import ExportService
     from sift.errors import SiftError
 
     output_path = Path(output) if output else None
 
     try:
-        svc = ExportService()
+        svc = _get_export_service()
         result_path = svc.export_template(template, output_path=output_path)
     except (SiftError, FileNotFoundError) as e:
         console.print(f"[red]{e}[/red]")
@@ -77,12 +91,11 @@ def import_session(
     overwrite: bool = typer.Option(False, "--overwrite", help="Overwrite existing session"),
 ):
     """Import a session from an exported file."""
-    from sift.core.export_service import ExportService
     from sift.errors import SiftError
 
     source_path = Path(file)
     try:
-        svc = ExportService()
+        svc = _get_export_service()
         result = svc.import_session(source_path, overwrite=overwrite)
     except (SiftError, FileNotFoundError, ValueError) as e:
         console.print(f"[red]{e}[/red]")
@@ -101,12 +114,11 @@ def import_template(
     overwrite: bool = typer.Option(False, "--overwrite", help="Overwrite existing template"),
 ):
     """Import a template from a YAML file."""
-    from sift.core.export_service import ExportService
     from sift.errors import SiftError
 
     source_path = Path(file)
     try:
-        svc = ExportService()
+        svc = _get_export_service()
         result_path = svc.import_template(source_path, overwrite=overwrite)
     except (SiftError, FileNotFoundError, ValueError) as e:
         console.print(f"[red]{e}[/red]")
@@ -1,19 +1,12 @@
 """Document import command: analyze and distribute multi-phase documents."""
 
-import shutil
-from datetime import datetime
 from pathlib import Path
 
 import typer
-from rich.panel import Panel
 from rich.prompt import Confirm
-from rich.table import Table
 
-from sift.document_analyzer import analyze_document_for_phases
 from sift.error_handler import handle_errors
-from sift.models import Session, ensure_dirs
-from sift.pdf import PDF_AVAILABLE, PDF_ENGINE, extract_text_from_pdf
-from sift.ui import ICONS, console, format_next_step
+from sift.ui import ICONS, console, format_next_step, pdf_stats_panel
 
 app = typer.Typer(no_args_is_help=True)
 
@@ -26,6 +19,14 @@ def import_document(
     auto: bool = typer.Option(False, "--auto", help="Skip confirmation, auto-apply mapping"),
 ):
     """Analyze a document and distribute sections to matching session phases."""
+    from datetime import datetime
+
+    from rich.table import Table
+
+    from sift.document_analyzer import analyze_document_for_phases, extract_pages
+    from sift.io_utils import link_or_copy
+    from sift.models import Session, ensure_dirs
+
     ensure_dirs()
 
     s = Session.load(session)  # raises SessionNotFoundError
@@ -40,6 +41,14 @@ def import_document(
     # ── Extract text ──
     suffix = file.suffix.lower()
     if suffix == ".pdf":
+        from sift.pdf import (
+            PDF_AVAILABLE,
+            PDF_ENGINE,
+            extract_text_from_pdf,
+            extract_text_from_pdf_cached,
+            pdf_cache_enabled,
+        )
+
         if not PDF_AVAILABLE:
             from sift.errors import CaptureError
 
@@ -47,27 +56,20 @@ def import_document(
 
         with console.status("[bold cyan]Reading PDF...[/bold cyan]"):
             try:
-                doc_text, pdf_stats = extract_text_from_pdf(file)
+                if pdf_cache_enabled():
+                    from sift.models import BASE_DIR
+
+                    doc_text, pdf_stats = extract_text_from_pdf_cached(
+                        file, BASE_DIR / "cache" / "pdf"
+                    )
+                else:
+                    doc_text, pdf_stats = extract_text_from_pdf(file)
             except Exception as e:
                 console.print(f"[red]Failed to extract PDF text: {e}[/red]")
                 raise typer.Exit(1)
 
         # Show extraction stats
-        stats_table = Table(show_header=False, box=None, padding=(0, 2))
-        stats_table.add_column(style="bold")
-        stats_table.add_column(style="green")
-        stats_table.add_row("Pages", str(pdf_stats["page_count"]))
-        stats_table.add_row("Tables found", str(pdf_stats["table_count"]))
-        stats_table.add_row("Characters", f"{pdf_stats['char_count']:,}")
-        stats_table.add_row("Engine", PDF_ENGINE)
-        console.print(
-            Panel(
-                stats_table,
-                title="[bold green]PDF Processed[/bold green]",
-                subtitle=file.name,
-                border_style="green",
-            )
-        )
+        console.print(pdf_stats_panel(pdf_stats, PDF_ENGINE, file.name))
 
     elif suffix in (".txt", ".md", ".text"):
         doc_text = file.read_text()
@@ -86,14 +88,18 @@ def import_document(
     # ── Store document at session level ──
     docs_dir = s.dir / "documents"
     docs_dir.mkdir(exist_ok=True)
-    doc_id = f"doc-{datetime.now().strftime('%H%M%S')}"
+    imported = datetime.now()
+    now = imported.isoformat()
+    doc_id = f"doc-{imported.strftime('%H%M%S')}"
     doc_dest = docs_dir / f"{doc_id}{suffix}"
-    shutil.copy2(file, doc_dest)
+    link_or_copy(file, doc_dest)
 
     # ── Analyze document against template phases ──
     console.print()
     with console.status("[bold cyan]Analyzing document against template phases...[/bold cyan]"):
-        mappings = analyze_document_for_phases(doc_text, tmpl.phases, tmpl.name)
+        mappings = analyze_document_for_phases(
+            doc_text, tmpl.phases, tmpl.name, include_content=False
+        )
 
     if not mappings:
         console.print("[yellow]Could not determine phase mappings for this document.[/yellow]")
@@ -101,8 +107,8 @@ def import_document(
         raise typer.Exit(0)
 
     # ── Display mapping results ──
-    mapped_ids = {m.phase_id for m in mappings}
-    unmapped_phases = [p for p in tmpl.phases if p.id not in mapped_ids]
+    mapping_by_id = {m.phase_id: m for m in mappings}
+    unmapped_phases = [p for p in tmpl.phases if p.id not in mapping_by_id]
 
     result_table = Table(
         title="Document Analysis",
@@ -117,7 +123,7 @@ def import_document(
     result_table.add_column("Match", min_width=8)
 
     for i, pt in enumerate(tmpl.phases, 1):
-        mapping = next((m for m in mappings if m.phase_id == pt.id), None)
+        mapping = mapping_by_id.get(pt.id)
         if mapping:
             confidence_style = {
                 "high": "green",
@@ -177,17 +183,17 @@ def import_document(
         ps = s.phases[mapping.phase_id]
         phase_dir = s.phase_dir(mapping.phase_id)
 
-        # Write transcript
+        # Write transcript (sliced per phase so only one phase's text is held at a time)
+        content = extract_pages(doc_text, mapping.matched_pages)
         transcript_dest = phase_dir / "transcript.txt"
-        transcript_dest.write_text(mapping.content)
+        transcript_dest.write_bytes(content.encode("utf-8"))
 
         # Copy source PDF to phase dir too
         if suffix == ".pdf":
             pdf_dest = phase_dir / "document.pdf"
-            shutil.copy2(file, pdf_dest)
+            link_or_copy(file, pdf_dest)
 
         # Update phase state
-        now = datetime.now().isoformat()
         ps.transcript_file = "transcript.txt"
         ps.status = "transcribed"
         ps.captured_at = now
@@ -195,7 +201,7 @@ def import_document(
         ps.source_document = doc_id
         ps.source_pages = mapping.matched_pages
 
-        char_count = len(mapping.content)
+        char_count = len(content)
         console.print(
             f"  {ICONS['complete']} {mapping.phase_name:30s} "
             f"[green]{char_count:,} chars[/green] [dim](pages {mapping.matched_pages})[/dim]"
@@ -206,7 +212,7 @@ def import_document(
         {
             "id": doc_id,
             "filename": file.name,
-            "imported_at": datetime.now().isoformat(),
+            "imported_at": now,
             "phases_mapped": [m.phase_id for m in mappings],
         }
     )
@@ -6,23 +6,36 @@ through their first session.
 
 from __future__ import annotations
 
+import os
 import sys
 
 import typer
+from rich.panel import Panel
 
 from sift.error_handler import handle_errors
 from sift.ui import ICONS, console
 
 app = typer.Typer(no_args_is_help=False)
 
+# Built-in templates shipped alongside the source tree (checkout / editable install)
+_PKG_TEMPLATES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "templates"
+)
+
 
 @app.callback(invoke_without_command=True)
 @handle_errors
 def init() -> None:
     """Set up sift for the first time (validate env, configure provider, run checks)."""
-    from rich.panel import Panel
     from rich.table import Table
 
+    # 1. Python version (checked before anything is rendered)
+    if sys.version_info < (3, 10):  # noqa: UP036
+        console.print(
+            "[red]Python 3.10+ is required. Please upgrade your Python installation.[/red]"
+        )
+        raise typer.Exit(1)
+
     console.print(
         Panel(
             "[bold cyan]  s i f t[/bold cyan]\n[dim]  First-time setup wizard[/dim]",
@@ -31,64 +44,45 @@ def init() -> None:
         )
     )
 
-    checks: list[tuple[str, bool, str]] = []
+    # (name, passed, detail); passed is None for continuation rows of the previous check
+    checks: list[tuple[str, bool | None, str]] = []
 
-    # 1. Python version
     py_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-    py_ok = sys.version_info >= (3, 10)
-    checks.append(
-        ("Python version", py_ok, f"{py_version} {'(OK)' if py_ok else '(requires 3.10+)'}")
-    )
-
-    if not py_ok:
-        console.print(
-            "[red]Python 3.10+ is required. Please upgrade your Python installation.[/red]"
-        )
-        raise typer.Exit(1)
+    checks.append(("Python version", True, f"{py_version} (OK)"))
 
     # 2. Data directories
     from sift.models import SESSIONS_DIR, TEMPLATES_DIR, ensure_dirs
 
     ensure_dirs()
     checks.append(("Data directories", True, f"Templates: {TEMPLATES_DIR}"))
-    checks.append(("", True, f"Sessions: {SESSIONS_DIR}"))
+    checks.append(("", None, f"Sessions: {SESSIONS_DIR}"))
 
     # 3. Templates check
-    template_count = len(list(TEMPLATES_DIR.glob("*.yaml"))) + len(
-        list(TEMPLATES_DIR.glob("*.yml"))
-    )
+    template_count = _count_templates(TEMPLATES_DIR)
     if template_count == 0:
-        _install_default_templates()
-        template_count = len(list(TEMPLATES_DIR.glob("*.yaml"))) + len(
-            list(TEMPLATES_DIR.glob("*.yml"))
-        )
+        template_count = _install_default_templates(template_count)
     checks.append(("Templates installed", template_count > 0, f"{template_count} templates"))
 
     # 4. Provider configuration
-    from sift.core.secrets import list_stored_providers
+    from sift.core.secrets import KEY_READY_STATUSES, list_stored_providers
 
-    key_status = list_stored_providers()
-    has_any_key = any(s in ("env", "keyring", "file", "no key needed") for s in key_status.values())
-
-    for provider_name, status in key_status.items():
-        has_key = status in ("env", "keyring", "file", "no key needed")
+    has_any_key = False
+    for provider_name, status in list_stored_providers().items():
+        has_key = status in KEY_READY_STATUSES
+        has_any_key = has_any_key or has_key
         checks.append((f"Provider: {provider_name}", has_key, f"API key: {status}"))
 
     # Display checks
-    console.print()
     table = Table(title="Environment Check", show_header=True, border_style="cyan")
     table.add_column("Check", min_width=22)
     table.add_column("Status", justify="center", width=6)
     table.add_column("Detail")
 
+    status_icons = {True: ICONS["complete"], False: ICONS["error"], None: ""}
     for name, passed, detail in checks:
-        if not name:
-            table.add_row("", "", detail)
-            continue
-        icon = ICONS["complete"] if passed else ICONS["error"]
-        table.add_row(name, icon, detail)
+        table.add_row(name, status_icons[passed], detail)
 
-    console.print(table)
+    console.print("", table)  # leading blank line rendered in the same call
 
     # 5. Offer to configure a provider if none available
     if not has_any_key:
@@ -97,76 +91,105 @@ def init() -> None:
             "sift needs an API key for transcription and extraction.\n"
         )
 
-        configure = typer.confirm("Would you like to configure a provider now?", default=True)
-        if configure:
+        if not sys.stdin.isatty():
+            # Scripted run: don't block on prompts nobody can answer
+            console.print(
+                "[dim]Non-interactive run: set ANTHROPIC_API_KEY or GOOGLE_API_KEY, "
+                "or run 'sift init' in a terminal.[/dim]"
+            )
+        elif typer.confirm("Would you like to configure a provider now?", default=True):
             _configure_provider()
     else:
         console.print("\n[green]Environment looks good![/green]")
 
-    # 6. Show next steps
-    console.print(
-        Panel(
-            "[bold]Try these next:[/bold]\n\n"
-            "  [cyan]sift demo[/cyan]                              "
-            "See sift in action (no API key needed)\n"
-            "  [cyan]sift new hello-world --name my-first[/cyan]   "
-            "Create your first real session\n"
-            "  [cyan]sift template list[/cyan]                     "
-            "Browse available templates\n"
-            "  [cyan]sift doctor[/cyan]                            "
-            "Run full diagnostics",
-            title="[bold cyan]What's next?[/bold cyan]",
-            border_style="cyan",
-            padding=(0, 2),
-        )
+    # 6. Show next steps (skip the Panel render tree when output isn't a terminal)
+    next_steps = (
+        "[bold]Try these next:[/bold]\n\n"
+        "  [cyan]sift demo[/cyan]                              "
+        "See sift in action (no API key needed)\n"
+        "  [cyan]sift new hello-world --name my-first[/cyan]   "
+        "Create your first real session\n"
+        "  [cyan]sift template list[/cyan]                     "
+        "Browse available templates\n"
+        "  [cyan]sift doctor[/cyan]                            "
+        "Run full diagnostics"
     )
+    if console.is_terminal:
+        console.print(
+            Panel(
+                next_steps,
+                title="[bold cyan]What's next?[/bold cyan]",
+                border_style="cyan",
+                padding=(0, 2),
+            )
+        )
+    else:
+        console.print(f"\n{next_steps}")
+
+
+def _count_templates(directory: str | os.PathLike[str]) -> int:
+    """Count template YAML files in a directory with a single scandir pass."""
+    with os.scandir(directory) as it:
+        return sum(1 for e in it if e.name.endswith((".yaml", ".yml")) and e.is_file())
 
 
-def _install_default_templates() -> None:
-    """Copy built-in templates to the user's template directory."""
+def _install_default_templates(existing: int = 0) -> int:
+    """Copy built-in templates to the user's template directory.
+
+    Returns the template count after installing (``existing`` plus the number copied),
+    so callers don't need to rescan the directory.
+    """
     import shutil
-    from pathlib import Path
 
     from sift.models import TEMPLATES_DIR
 
     # Find the package templates directory
-    package_dir = Path(__file__).parent.parent.parent / "templates"
-    if not package_dir.exists():
-        # Try as installed package
+    package_dir = _PKG_TEMPLATES_DIR
+    if not os.path.isdir(package_dir):
+        # Try as installed package (files() resolves the directory without
+        # materializing a resource the way the deprecated path() API does)
         import importlib.resources
 
         try:
-            with importlib.resources.path("sift", "__init__") as p:
-                package_dir = p.parent.parent / "templates"
+            package_dir = os.path.join(
+                os.path.dirname(str(importlib.resources.files("sift"))), "templates"
+            )
         except Exception:
             console.print("[dim]Could not locate built-in templates.[/dim]")
-            return
+            return existing
 
-    if not package_dir.exists():
-        return
+    if not os.path.isdir(package_dir):
+        return existing
 
     count = 0
-    for template_file in package_dir.glob("*.yaml"):
-        dest = TEMPLATES_DIR / template_file.name
-        if not dest.exists():
-            shutil.copy2(template_file, dest)
-            count += 1
+    with os.scandir(package_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".yaml"):
+                continue
+            dest = TEMPLATES_DIR / entry.name
+            if not os.path.exists(dest):
+                shutil.copy2(entry.path, dest)
+                count += 1
 
     if count > 0:
         console.print(f"[dim]Installed {count} default templates.[/dim]")
+    return existing + count
 
 
 def _configure_provider() -> None:
     """Interactive provider configuration."""
     from sift.core.secrets import store_key
 
-    console.print("[bold]Choose a provider:[/bold]")
-    console.print("  1. [cyan]Anthropic[/cyan] (Claude) - Recommended")
-    console.print("  2. [cyan]Google Gemini[/cyan]")
-    console.print("  3. [cyan]Ollama[/cyan] (Local, no API key needed)")
-    console.print()
+    prompt = typer.prompt
 
-    choice = typer.prompt("Enter choice (1-3)", default="1")
+    console.print(
+        "[bold]Choose a provider:[/bold]\n"
+        "  1. [cyan]Anthropic[/cyan] (Claude) - Recommended\n"
+        "  2. [cyan]Google Gemini[/cyan]\n"
+        "  3. [cyan]Ollama[/cyan] (Local, no API key needed)\n"
+    )
+
+    choice = prompt("Enter choice (1-3)", default="1")
 
     provider_map = {"1": "anthropic", "2": "gemini", "3": "ollama"}
     provider = provider_map.get(choice, "anthropic")
@@ -185,10 +208,12 @@ def _configure_provider() -> None:
     env_var_map = {"anthropic": "ANTHROPIC_API_KEY", "gemini": "GOOGLE_API_KEY"}
     env_var = env_var_map[provider]
 
-    console.print(f"\nEnter your {provider} API key.")
-    console.print(f"[dim](This will be stored securely. You can also set {env_var} instead.)[/dim]")
+    console.print(
+        f"\nEnter your {provider} API key.\n"
+        f"[dim](This will be stored securely. You can also set {env_var} instead.)[/dim]"
+    )
 
-    api_key = typer.prompt("API key", hide_input=True)
+    api_key = prompt("API key", hide_input=True)
     if not api_key.strip():
         console.print("[yellow]No key entered. Skipping provider configuration.[/yellow]")
         return
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import typer
-from rich.table import Table
 
 from sift.completions import complete_session_name
 from sift.error_handler import handle_errors
 from sift.ui import ICONS, console
 
+if TYPE_CHECKING:
+    from sift.core.migration_service import MigrationResult
+
 app = typer.Typer(no_args_is_help=False)
 
 
@@ -31,6 +35,8 @@ def migrate(
     ),
 ) -> None:
     """Migrate sessions and templates to the current schema version."""
+    from rich.table import Table
+
     from sift.core.migration_service import MigrationService
 
     svc = MigrationService()
@@ -62,45 +68,39 @@ def migrate(
     table.add_column("Status", justify="center")
     table.add_column("Details")
 
-    for result in summary.sessions:
-        icon = ICONS["complete"] if result.migrated else ICONS["pending"]
-        version_str = f"v{result.source_version} -> v{result.target_version}"
-        table.add_row(
-            result.name,
-            "session",
-            version_str,
-            icon,
-            "; ".join(result.changes),
-        )
-
-    for result in summary.templates:
-        icon = ICONS["complete"] if result.migrated else ICONS["pending"]
-        version_str = f"v{result.source_version} -> v{result.target_version}"
-        table.add_row(
-            result.name,
-            "template",
-            version_str,
-            icon,
-            "; ".join(result.changes),
-        )
+    ok_icon = ICONS["complete"]
+    pending_icon = ICONS["pending"]
+
+    # Most items share the same (source, target) pair, so build each label once
+    version_labels: dict[tuple[int, int], str] = {}
+
+    for kind, results in (("session", summary.sessions), ("template", summary.templates)):
+        for result in results:
+            key = (result.source_version, result.target_version)
+            version_str = version_labels.get(key)
+            if version_str is None:
+                version_str = version_labels[key] = f"v{key[0]} -> v{key[1]}"
+            table.add_row(
+                result.name,
+                kind,
+                version_str,
+                ok_icon if result.migrated else pending_icon,
+                result.changes_joined,
+            )
 
     console.print(table)
 
-    console.print(
+    totals = (
         f"\n[bold]{summary.total_migrated}[/bold] migrated, "
         f"[dim]{summary.total_skipped} already current[/dim]"
     )
     if dry_run and summary.total_migrated > 0:
-        console.print("[yellow]Re-run without --dry-run to apply changes.[/yellow]")
+        totals += "\n[yellow]Re-run without --dry-run to apply changes.[/yellow]"
+    console.print(totals)
 
 
-def _display_single_result(result: object) -> None:
+def _display_single_result(result: MigrationResult) -> None:
     """Display a single migration result."""
-    from sift.core.migration_service import MigrationResult
-
-    if not isinstance(result, MigrationResult):
-        return
-
     if result.migrated:
         icon = ICONS["complete"]
         console.print(
@@ -1,41 +1,54 @@
 """Phase-level commands: capture, transcribe, extract - thin CLI wrappers."""
 
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
+from rich.markup import escape
 from rich.panel import Panel
-from rich.table import Table as RichTable
 
 from sift.completions import complete_phase_id, complete_session_name
-from sift.core.extraction_service import ExtractionService
 from sift.error_handler import handle_errors
-from sift.pdf import PDF_ENGINE
-from sift.ui import console, format_next_step
+from sift.ui import console, format_next_step, pdf_stats_panel, read_until_end
+
+if TYPE_CHECKING:
+    from sift.core.extraction_service import ExtractionService
 
 app = typer.Typer(no_args_is_help=True)
 
-_svc = ExtractionService()
+_svc: ExtractionService | None = None
+
 
+# Suggested follow-up command for the next incomplete phase, keyed by its status
+_NEXT_STEP_BY_STATUS = {
+    "pending": "sift phase capture {session} --phase {phase}",
+    "captured": "sift phase transcribe {session} --phase {phase}",
+}
+_DEFAULT_NEXT_STEP = "sift phase extract {session} --phase {phase}"
 
-def _phase_has_content(session: str, phase: str) -> bool:
-    """Check if a phase already has a transcript."""
-    from sift.models import Session
 
-    try:
-        s = Session.load(session)
-        ps = s.phases.get(phase)
-        return bool(ps and ps.status not in ("pending",))
-    except Exception:
-        return False
+def _get_svc() -> ExtractionService:
+    """Get or create the ExtractionService (deferred so `sift --help` skips it)."""
+    global _svc
+    if _svc is None:
+        from sift.core.extraction_service import ExtractionService
+
+        _svc = ExtractionService()
+    return _svc
 
 
 def _ask_append_or_replace() -> str:
     """Ask user whether to append, replace, or cancel."""
-    console.print("\n[yellow]This phase already has content.[/yellow]\n")
-    console.print("  [bold]1[/bold]. Append more content")
-    console.print("  [bold]2[/bold]. Replace existing content")
-    console.print("  [bold]3[/bold]. Cancel")
-    console.print()
+    console.print(
+        "\n[yellow]This phase already has content.[/yellow]\n\n"
+        "  [bold]1[/bold]. Append more content\n"
+        "  [bold]2[/bold]. Replace existing content\n"
+        "  [bold]3[/bold]. Cancel\n"
+    )
     choice = typer.prompt("Choice", type=int, default=1)
     if choice == 1:
         return "append"
@@ -44,23 +57,22 @@ def _ask_append_or_replace() -> str:
     return "cancel"
 
 
+def _refuse_existing_content() -> str:
+    """on_existing handler for non-interactive runs, where prompting would block."""
+    from sift.errors import CaptureError
+
+    raise CaptureError(
+        "This phase already has content. Use --append or --replace for non-interactive runs."
+    )
+
+
 def _read_text_input() -> str:
     """Read multi-line text from stdin until END or Ctrl+C/EOF."""
-    console.print("\n[bold]Enter transcript text.[/bold]")
     console.print(
+        "\n[bold]Enter transcript text.[/bold]\n"
         "[dim]Type or paste your text. Enter an empty line followed by 'END' to finish.[/dim]\n"
     )
-    lines = []
-    while True:
-        try:
-            line = input()
-            if line.strip() == "END":
-                break
-            lines.append(line)
-        except (EOFError, KeyboardInterrupt):
-            console.print()
-            break
-    return "\n".join(lines)
+    return read_until_end()
 
 
 @app.command("capture")
@@ -105,18 +117,22 @@ def capture_phase(
         format_next_step(f"sift phase extract {session} --phase {phase}")
         return
 
-    has_content = _phase_has_content(session, phase)
+    # The service asks via this callback only if the phase already has content,
+    # so the session is loaded once rather than checked up front.
+    if append or replace:
+        on_existing = None
+    elif sys.stdin.isatty():
+        on_existing = _ask_append_or_replace
+    else:
+        on_existing = _refuse_existing_content
 
-    # Determine append mode for direct flags (--file or --text)
-    if has_content and (file or text) and not append and not replace:
-        action = _ask_append_or_replace()
-        if action == "cancel":
+    if file:
+        result = _get_svc().capture_file(
+            session, phase, file, append=append, on_existing=on_existing
+        )
+        if result.cancelled:
             console.print("[dim]Cancelled.[/dim]")
             return
-        append = action == "append"
-
-    if file:
-        result = _svc.capture_file(session, phase, file, append=append)
         _render_capture_result(result, file, session, phase)
 
         # If multi-phase detected, suggest import command
@@ -137,38 +153,48 @@ def capture_phase(
             console.print("[yellow]No text entered. Aborting.[/yellow]")
             raise typer.Exit(0)
 
-        result = _svc.capture_text(session, phase, transcript, append=append)
+        result = _get_svc().capture_text(
+            session, phase, transcript, append=append, on_existing=on_existing
+        )
+        if result.cancelled:
+            console.print("[dim]Cancelled.[/dim]")
+            return
         label = "appended to transcript" if result.appended else "Transcript saved"
         console.print(f"\n[green]{label} ({result.char_count} chars)[/green]")
         format_next_step(f"sift phase extract {session} --phase {phase}")
 
     else:
         # Interactive mode — ask what to do
-        if has_content:
-            action = _ask_append_or_replace()
-            if action == "cancel":
-                console.print("[dim]Cancelled.[/dim]")
-                return
-            append = action == "append"
-
-        console.print("\nHow would you like to capture this phase?\n")
-        console.print("  [bold]1[/bold]. Upload a file (audio, transcript, or PDF)")
-        console.print("  [bold]2[/bold]. Enter/paste text directly")
-        console.print("  [bold]3[/bold]. Skip for now")
-        console.print()
+        console.print(
+            "\nHow would you like to capture this phase?\n\n"
+            "  [bold]1[/bold]. Upload a file (audio, transcript, or PDF)\n"
+            "  [bold]2[/bold]. Enter/paste text directly\n"
+            "  [bold]3[/bold]. Skip for now\n"
+        )
 
-        choice = typer.prompt("Choice", type=int, default=1)
+        prompt = typer.prompt
+        choice = prompt("Choice", type=int, default=1)
 
         if choice == 1:
-            file_path = typer.prompt("File path")
-            result = _svc.capture_file(session, phase, Path(file_path), append=append)
+            file_path = prompt("File path")
+            result = _get_svc().capture_file(
+                session, phase, Path(file_path), append=append, on_existing=on_existing
+            )
+            if result.cancelled:
+                console.print("[dim]Cancelled.[/dim]")
+                return
             _render_capture_result(result, Path(file_path), session, phase)
         elif choice == 2:
             transcript = _read_text_input()
             if not transcript.strip():
                 console.print("[yellow]No text entered. Aborting.[/yellow]")
                 return
-            result = _svc.capture_text(session, phase, transcript, append=append)
+            result = _get_svc().capture_text(
+                session, phase, transcript, append=append, on_existing=on_existing
+            )
+            if result.cancelled:
+                console.print("[dim]Cancelled.[/dim]")
+                return
             label = "appended to transcript" if result.appended else "Transcript saved"
             console.print(f"\n[green]{label} ({result.char_count} chars)[/green]")
             format_next_step(f"sift phase extract {session} --phase {phase}")
@@ -185,7 +211,7 @@ def transcribe_phase(
     ),
 ):
     """Transcribe audio for a session phase."""
-    result = _svc.transcribe_phase(session, phase)
+    result = _get_svc().transcribe_phase(session, phase)
 
     console.print(f"\n[green]Transcription complete ({result.char_count} chars)[/green]")
     console.print(
@@ -208,7 +234,7 @@ def extract_phase(
 ):
     """Extract structured data from a phase transcript."""
     with console.status("[bold]Extracting structured data...[/bold]"):
-        result = _svc.extract_phase(session, phase)
+        result = _get_svc().extract_phase(session, phase)
 
     if not result.fields:
         console.print(
@@ -220,17 +246,11 @@ def extract_phase(
     _render_extracted_fields(result.fields)
 
     # Suggest next action
-    remaining = _svc.get_remaining_phases(session)
+    remaining = _get_svc().get_remaining_phases(session)
     if remaining:
         next_p = remaining[0]
-        status = next_p["status"]
-        pid = next_p["phase_id"]
-        if status == "pending":
-            format_next_step(f"sift phase capture {session} --phase {pid}")
-        elif status == "captured":
-            format_next_step(f"sift phase transcribe {session} --phase {pid}")
-        else:
-            format_next_step(f"sift phase extract {session} --phase {pid}")
+        step = _NEXT_STEP_BY_STATUS.get(next_p["status"], _DEFAULT_NEXT_STEP)
+        format_next_step(step.format(session=session, phase=next_p["phase_id"]))
     else:
         console.print("\n  [bold green]All phases complete![/bold green]")
         format_next_step(f"sift build generate {session}")
@@ -250,42 +270,52 @@ def _render_capture_result(result, file: Path, session: str, phase: str):
         format_next_step(f"sift phase extract {session} --phase {phase}")
 
     elif result.file_type == "pdf" and result.pdf_stats:
-        stats_table = RichTable(show_header=False, box=None, padding=(0, 2))
-        stats_table.add_column(style="bold")
-        stats_table.add_column(style="green")
-        stats_table.add_row("Pages", str(result.pdf_stats["page_count"]))
-        stats_table.add_row("Tables found", str(result.pdf_stats["table_count"]))
-        stats_table.add_row("Characters", f"{result.pdf_stats['char_count']:,}")
-        stats_table.add_row("Engine", PDF_ENGINE or "unknown")
+        from sift.pdf import PDF_ENGINE
 
-        console.print(
-            Panel(
-                stats_table,
-                title="[bold green]PDF Processed[/bold green]",
-                subtitle=file.name,
-                border_style="green",
-            )
-        )
+        console.print(pdf_stats_panel(result.pdf_stats, PDF_ENGINE, file.name))
         format_next_step(f"sift phase extract {session} --phase {phase}")
 
 
 def _render_extracted_fields(fields: dict):
-    """Render extracted field data."""
+    """Render extracted field data, escaping values since they are model output."""
+    lines: list[str] = []
     for field_id, value in fields.items():
         if field_id.startswith("_"):
             continue
-        console.print(f"[bold cyan]{field_id}:[/bold cyan]")
-        if isinstance(value, list):
-            for item in value:
-                if isinstance(item, dict):
-                    for k, v in item.items():
-                        console.print(f"    [bold]{k}:[/bold] {v}")
-                    console.print()
-                else:
-                    console.print(f"  \u2022 {item}")
-        elif isinstance(value, dict):
-            for k, v in value.items():
-                console.print(f"  [bold]{k}:[/bold] {v}")
-        else:
-            console.print(f"  {value}")
-        console.print()
+        lines.append(f"[bold cyan]{escape(field_id)}:[/bold cyan]")
+        _FIELD_RENDERERS.get(type(value), _render_scalar_field)(value, lines)
+        lines.append("")
+
+    if lines:
+        console.print("\n".join(lines))
+
+
+def _render_list_field(value: list, lines: list[str]) -> None:
+    for item in value:
+        _LIST_ITEM_RENDERERS.get(type(item), _render_bullet_item)(item, lines)
+
+
+def _render_dict_field(value: dict, lines: list[str]) -> None:
+    lines.extend(f"  [bold]{escape(str(k))}:[/bold] {escape(str(v))}" for k, v in value.items())
+
+
+def _render_scalar_field(value, lines: list[str]) -> None:
+    lines.append(f"  {escape(str(value))}")
+
+
+def _render_dict_item(item: dict, lines: list[str]) -> None:
+    lines.extend(f"    [bold]{escape(str(k))}:[/bold] {escape(str(v))}" for k, v in item.items())
+    lines.append("")
+
+
+def _render_bullet_item(item, lines: list[str]) -> None:
+    lines.append(f"  \u2022 {escape(str(item))}")
+
+
+# Extracted data is plain YAML-loaded types, so dispatch on the exact type
+# rather than walking isinstance checks per item
+_FIELD_RENDERERS: dict[type, Callable[[Any, list[str]], None]] = {
+    list: _render_list_field,
+    dict: _render_dict_field,
+}
+_LIST_ITEM_RENDERERS: dict[type, Callable[[Any, list[str]], None]] = {dict: _render_dict_item}
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import typer
-from rich.table import Table
 
 from sift.ui import ICONS, console
 
@@ -24,6 +23,8 @@ def plugins(
     formatters: bool = typer.Option(False, "--formatters", help="Show formatter plugins only"),
 ):
     """List all discovered plugins."""
+    from rich.table import Table
+
     from sift.plugins import ANALYZER_GROUP, FORMATTER_GROUP, PROVIDER_GROUP, list_all_plugins
 
     all_plugins = list_all_plugins()
@@ -1,19 +1,42 @@
 """Session management commands - thin CLI wrappers over SessionService."""
 
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.panel import Panel
-from rich.table import Table
 
 from sift.completions import complete_session_name, complete_template_name
-from sift.core.session_service import SessionService
 from sift.error_handler import handle_errors
-from sift.ui import ICONS, console, format_next_step, pipeline_view
+from sift.ui import (
+    ICONS,
+    PLAIN_TABLE_MIN_ROWS,
+    console,
+    format_next_step,
+    pipeline_view,
+    print_plain_table,
+)
+
+if TYPE_CHECKING:
+    from sift.core.session_service import SessionService
 
 app = typer.Typer(no_args_is_help=True)
 
-_svc = SessionService()
+_svc: SessionService | None = None
+
+_STATUS_COLOR = {"active": "yellow", "complete": "green", "archived": "dim"}
+
+
+def _get_svc() -> SessionService:
+    """Get or create the SessionService shared by the session commands."""
+    global _svc
+    if _svc is None:
+        from sift.core.session_service import SessionService
+
+        _svc = SessionService()
+    return _svc
 
 
 @app.command("create")
@@ -25,7 +48,7 @@ def create(
     name: str = typer.Option(None, "--name", "-n", help="Session name"),
 ):
     """Create a new session from a template (use '+' to combine: discovery-call+workflow-extraction)."""
-    detail = _svc.create_session(template, name)
+    detail = _get_svc().create_session(template, name)
     _render_session_created(detail)
 
 
@@ -33,13 +56,36 @@ def create(
 @handle_errors
 def list_sessions():
     """List all sessions."""
-    sessions = _svc.list_sessions()
+    sessions = _get_svc().list_sessions()
 
     if not sessions:
         console.print("[yellow]No sessions found.[/yellow]")
         console.print("Create one: sift new <template>")
         return
 
+    rows = []
+    for s in sessions:
+        progress = f"{s.done_phases}/{s.total_phases} done"
+        if s.in_progress_phases:
+            progress += f", {s.in_progress_phases} in progress"
+        rows.append(
+            (
+                s.name,
+                s.template_name,
+                s.status,
+                progress,
+                s.updated_at[:16] if s.updated_at else "-",
+            )
+        )
+
+    headers = ("Name", "Template", "Status", "Progress", "Updated")
+    if len(rows) > PLAIN_TABLE_MIN_ROWS and not console.is_terminal:
+        print_plain_table("Sessions", headers, rows)
+        return
+
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(title="Sessions")
     table.add_column("Name", style="bold cyan")
     table.add_column("Template")
@@ -47,23 +93,16 @@ def list_sessions():
     table.add_column("Progress")
     table.add_column("Updated")
 
-    for s in sessions:
-        progress = f"{s.done_phases}/{s.total_phases} done"
-        if s.in_progress_phases:
-            progress += f", {s.in_progress_phases} in progress"
-
-        status_color = {
-            "active": "yellow",
-            "complete": "green",
-            "archived": "dim",
-        }.get(s.status, "white")
+    for name, template_name, status, progress, updated in rows:
+        status_color = _STATUS_COLOR.get(status, "white")
 
+        # Text cells skip markup parsing for every row
         table.add_row(
-            s.name,
-            s.template_name,
-            f"[{status_color}]{s.status}[/{status_color}]",
-            progress,
-            s.updated_at[:16] if s.updated_at else "-",
+            Text(name),
+            Text(template_name),
+            Text(status, style=status_color),
+            Text(progress),
+            Text(updated),
         )
 
     console.print(table)
@@ -75,7 +114,7 @@ def show_status(
     session: str = typer.Argument(..., help="Session name", autocompletion=complete_session_name),
 ):
     """Show detailed session status."""
-    detail = _svc.get_session_status(session)
+    detail = _get_svc().get_session_status(session)
     _render_session_status(detail, session)
 
 
@@ -86,7 +125,7 @@ def export_session(
     output: Path = typer.Option(".", "--output", "-o", help="Output directory"),
 ):
     """Export all session data as a single YAML."""
-    result = _svc.export_session(session, output)
+    result = _get_svc().export_session(session, output)
     console.print(f"[green]Exported to {result.output_path}[/green]")
 
 
@@ -114,6 +153,9 @@ def _render_session_created(detail):
 
 def _render_session_status(detail, session_name: str):
     """Render detailed session status."""
+    from rich.table import Table
+    from rich.text import Text
+
     console.print(
         Panel(
             f"[bold]{detail.template_name}[/bold]\n"
@@ -137,19 +179,24 @@ def _render_session_status(detail, session_name: str):
     table.add_column("Transcript", justify="center")
     table.add_column("Extracted", justify="center")
 
+    # Cell markup is parsed once per distinct value; rows get copies of the parsed Text
+    pending_icon = ICONS["pending"]
+    status_cells: dict[str, Text] = {}
+    # Indexed by the has_* flags: False -> dash, True -> check mark
+    presence = (Text.from_markup("[dim]\u2014[/dim]"), Text.from_markup(ICONS["complete"]))
     for i, p in enumerate(detail.phases, 1):
-        icon = ICONS.get(p.status, ICONS["pending"])
-        audio = ICONS["complete"] if p.has_audio else "[dim]\u2014[/dim]"
-        transcript = ICONS["complete"] if p.has_transcript else "[dim]\u2014[/dim]"
-        extracted = ICONS["complete"] if p.has_extracted else "[dim]\u2014[/dim]"
-
+        status_cell = status_cells.get(p.status)
+        if status_cell is None:
+            status_cell = status_cells[p.status] = Text.from_markup(
+                f"{ICONS.get(p.status, pending_icon)} {p.status}"
+            )
         table.add_row(
             str(i),
-            f"[bold]{p.name}[/bold]",
-            f"{icon} {p.status}",
-            audio,
-            transcript,
-            extracted,
+            Text.assemble((p.name, "bold")),
+            status_cell.copy(),
+            presence[p.has_audio].copy(),
+            presence[p.has_transcript].copy(),
+            presence[p.has_extracted].copy(),
         )
 
     console.print(table)
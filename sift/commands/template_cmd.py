@@ -1,26 +1,43 @@
 """Template management commands - thin CLI wrappers over TemplateService."""
 
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 import typer
-from rich.table import Table
+from rich.markup import escape
 
 from sift.completions import complete_template_name
-from sift.core.template_service import TemplateService
 from sift.error_handler import handle_errors
 from sift.ui import console
 
+if TYPE_CHECKING:
+    from sift.core.template_service import TemplateService
+
 app = typer.Typer(no_args_is_help=True)
 
-_svc = TemplateService()
+_svc: TemplateService | None = None
+
+
+def _get_svc() -> TemplateService:
+    """Get or create the TemplateService shared by the template commands."""
+    global _svc
+    if _svc is None:
+        from sift.core.template_service import TemplateService
+
+        _svc = TemplateService()
+    return _svc
 
 
 @app.command("list")
 @handle_errors
 def list_templates():
     """List available session templates."""
-    templates = _svc.list_templates()
+    from rich.table import Table
+
+    templates = _get_svc().list_templates()
 
     if not templates:
         console.print("[yellow]No templates found.[/yellow]")
@@ -51,30 +68,37 @@ def show_template(
     name: str = typer.Argument(..., help="Template name", autocompletion=complete_template_name),
 ):
     """Show details of a template."""
-    detail = _svc.show_template(name)
+    detail = _get_svc().show_template(name)
 
-    console.print(f"\n[bold cyan]{detail.name}[/bold cyan]")
-    console.print(f"[dim]{detail.description}[/dim]\n")
+    # Build the whole listing first and render it with a single print; template
+    # text is user-written, so it is escaped before being joined into markup
+    lines = [
+        f"\n[bold cyan]{escape(detail.name)}[/bold cyan]",
+        f"[dim]{escape(detail.description)}[/dim]\n",
+    ]
 
     for i, phase in enumerate(detail.phases, 1):
         capture_types = ", ".join(phase.capture_types) or "none"
         status = "required" if phase.required else "optional"
 
-        console.print(f"  [bold]{i}. {phase.name}[/bold] [dim]({phase.id})[/dim]")
+        lines.append(f"  [bold]{i}. {escape(phase.name)}[/bold] [dim]({escape(phase.id)})[/dim]")
         prompt_display = phase.prompt[:80] + "..." if len(phase.prompt) > 80 else phase.prompt
-        console.print(f"     Prompt: [italic]{prompt_display}[/italic]")
-        console.print(f"     Capture: {capture_types} ({status})")
+        lines.append(f"     Prompt: [italic]{escape(prompt_display)}[/italic]")
+        lines.append(f"     Capture: {escape(capture_types)} ({status})")
         if phase.extract_field_ids:
             fields = ", ".join(phase.extract_field_ids)
-            console.print(f"     Extract: {fields}")
+            lines.append(f"     Extract: {escape(fields)}")
         if phase.depends_on:
-            console.print(f"     Depends on: {phase.depends_on}")
-        console.print()
+            lines.append(f"     Depends on: {escape(str(phase.depends_on))}")
+        lines.append("")
 
     if detail.outputs:
-        console.print("[bold]Outputs:[/bold]")
-        for o in detail.outputs:
-            console.print(f"  - {o['type']}: {o['template']}")
+        lines.append("[bold]Outputs:[/bold]")
+        lines.extend(
+            f"  - {escape(str(o['type']))}: {escape(str(o['template']))}" for o in detail.outputs
+        )
+
+    console.print("\n".join(lines))
 
 
 @app.command("init")
@@ -152,7 +176,7 @@ def init_template():
         ],
     }
 
-    path = _svc.create_template(template_data)
+    path = _get_svc().create_template(template_data)
     console.print(f"\n[green]Template saved to {path}[/green]")
 
 
@@ -162,7 +186,7 @@ def import_template(
     path: Path = typer.Argument(..., help="Path to template YAML file"),
 ):
     """Import a template from a file."""
-    info = _svc.import_template(path)
+    info = _get_svc().import_template(path)
     console.print(f"[green]Imported '{info.name}' ({info.phase_count} phases)[/green]")
 
 
@@ -173,7 +197,7 @@ def install_template(
 ):
     """Install a template from a URL (e.g., GitHub raw file)."""
     with console.status(f"[cyan]Downloading template from {url}...[/cyan]"):
-        info = _svc.install_from_url(url)
+        info = _get_svc().install_from_url(url)
     console.print(f"[green]Installed '{info.name}' ({info.phase_count} phases)[/green]")
 
 
@@ -183,7 +207,9 @@ def search_templates(
     query: str = typer.Argument(..., help="Search query (matches name, description, tags)"),
 ):
     """Search templates by name, description, or tags."""
-    results = _svc.search_templates(query)
+    from rich.table import Table
+
+    results = _get_svc().search_templates(query)
 
     if not results:
         console.print(f"[yellow]No templates matching '{query}'[/yellow]")
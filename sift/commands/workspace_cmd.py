@@ -2,21 +2,52 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import yaml
-from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
-from rich.table import Table
-from rich.text import Text
 
-from sift.core.build_service import BuildService
-from sift.core.extraction_service import ExtractionService
 from sift.models import Session, ensure_dirs
-from sift.ui import ICONS, console, pipeline_view, section_divider
+from sift.ui import (
+    ICONS,
+    ChoicePrompt,
+    console,
+    pipeline_view,
+    read_until_end,
+    section_divider,
+)
 
-_extraction_svc = ExtractionService()
-_build_svc = BuildService()
+if TYPE_CHECKING:
+    from sift.core.build_service import BuildService
+    from sift.core.extraction_service import ExtractionService
+
+# Fields listed per page by the refine action
+_REFINE_PAGE_SIZE = 20
+
+_extraction_svc: ExtractionService | None = None
+_build_svc: BuildService | None = None
+
+
+def _get_extraction_svc() -> ExtractionService:
+    """Get or create the ExtractionService used by the workspace actions."""
+    global _extraction_svc
+    if _extraction_svc is None:
+        from sift.core.extraction_service import ExtractionService
+
+        _extraction_svc = ExtractionService()
+    return _extraction_svc
+
+
+def _get_build_svc() -> BuildService:
+    """Get or create the BuildService used by the rebuild action."""
+    global _build_svc
+    if _build_svc is None:
+        from sift.core.build_service import BuildService
+
+        _build_svc = BuildService()
+    return _build_svc
 
 
 def _build_phase_list(session: Session, template) -> list[dict]:
@@ -34,11 +65,19 @@ def _build_phase_list(session: Session, template) -> list[dict]:
     return phases
 
 
-def _show_workspace_header(session: Session, template):
+def _show_workspace_header(session: Session, template, phases: list[dict]):
     """Show the workspace header with session info and pipeline."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     total = len(template.phases)
-    done = sum(1 for p in session.phases.values() if p.status in ("extracted", "complete"))
-    in_prog = sum(1 for p in session.phases.values() if p.status in ("captured", "transcribed"))
+    done = in_prog = 0
+    for ps in session.phases.values():
+        status = ps.status
+        if status == "extracted" or status == "complete":
+            done += 1
+        elif status == "captured" or status == "transcribed":
+            in_prog += 1
 
     progress_text = f"[green]{done}[/green]/{total} complete"
     if in_prog:
@@ -59,42 +98,104 @@ def _show_workspace_header(session: Session, template):
         )
     )
     console.print()
-    pipeline_view(_build_phase_list(session, template))
+    pipeline_view(phases)
 
 
 def _phase_picker(
-    session: Session, template, filter_status: list[str] = None, prompt_text: str = "Select phase"
+    phases: list[dict], filter_status: list[str] = None, prompt_text: str = "Select phase"
 ) -> str:
-    """Show numbered phase list and let user pick one. Returns phase_id or None."""
-    eligible = []
-    for i, pt in enumerate(template.phases, 1):
-        ps = session.phases.get(pt.id)
-        status = ps.status if ps else "pending"
-        if filter_status and status not in filter_status:
-            continue
-        eligible.append((i, pt, status))
+    """Show numbered phase list and let user pick one. Returns phase_id or None.
+
+    Takes the rows from _build_phase_list, so the header and every picker in
+    one workspace loop share a single pass over the session's phase states.
+    """
+    eligible = [
+        (i, p) for i, p in enumerate(phases, 1) if not filter_status or p["status"] in filter_status
+    ]
 
     if not eligible:
         console.print("  [dim]No eligible phases.[/dim]")
         return None
 
-    for i, pt, status in eligible:
-        icon = ICONS.get(status, ICONS["pending"])
-        console.print(f"    [bold cyan]{i}[/bold cyan]  {icon} {pt.name} [dim]({status})[/dim]")
+    pending_icon = ICONS["pending"]
+    for i, p in eligible:
+        icon = ICONS.get(p["status"], pending_icon)
+        console.print(
+            f"    [bold cyan]{i}[/bold cyan]  {icon} {p['name']} [dim]({p['status']})[/dim]"
+        )
 
     console.print()
-    choices = [str(i) for i, _, _ in eligible]
-    choice = Prompt.ask(f"  {prompt_text}", choices=choices)
-    selected = next((pt for i, pt, _ in eligible if str(i) == choice), None)
-    return selected.id if selected else None
+    by_choice = {str(i): p["id"] for i, p in eligible}
+    choice = ChoicePrompt.ask(f"  {prompt_text}", choices=list(by_choice))
+    return by_choice.get(choice)
+
+
+def _fmt_list(value: list) -> str:
+    """Extraction table cell for a list field: first five items as bullets."""
+    if not value:
+        return "[dim](none)[/dim]"
+    display = "\n".join(
+        f"\u2022 {item}"
+        if not isinstance(item, dict)
+        else "\u2022 " + ", ".join(f"{k}: {v}" for k, v in item.items())
+        for item in value[:5]
+    )
+    if len(value) > 5:
+        display += f"\n  [dim]... and {len(value) - 5} more[/dim]"
+    return display
+
+
+def _fmt_dict(value: dict) -> str:
+    """Extraction table cell for a mapping field: first five key/value lines."""
+    display = "\n".join(f"{k}: {v}" for k, v in islice(value.items(), 5))
+    if len(value) > 5:
+        display += f"\n[dim]... and {len(value) - 5} more[/dim]"
+    return display
+
+
+def _fmt_scalar(value) -> str:
+    """Extraction table cell for any other value, cut at 200 characters."""
+    text = str(value)
+    return text[:200] + "..." if len(text) > 200 else text
+
+
+# Cell formatters by exact type for the common YAML values. Anything else
+# (dates, timestamps, binary, sets, subclasses) goes through _formatter_for
+_FORMATTERS: dict[type, Callable[..., str]] = {
+    list: _fmt_list,
+    dict: _fmt_dict,
+    str: _fmt_scalar,
+    int: _fmt_scalar,
+    float: _fmt_scalar,
+    bool: _fmt_scalar,
+    type(None): _fmt_scalar,
+}
+
+
+def _formatter_for(value: Any) -> Callable[..., str]:
+    """Formatter for values whose exact type is not in _FORMATTERS."""
+    if isinstance(value, list):
+        return _fmt_list
+    if isinstance(value, dict):
+        return _fmt_dict
+    return _fmt_scalar
 
 
 def _show_extraction_table(extracted: dict, phase_name: str):
     """Show extracted data as a Rich table."""
+    from rich.table import Table
+
     if not extracted:
         console.print(f"  [dim]No extracted data for {phase_name}.[/dim]")
         return
 
+    rows = []
+    for field_id, value in extracted.items():
+        if field_id.startswith("_"):
+            continue
+        fmt = _FORMATTERS.get(type(value)) or _formatter_for(value)
+        rows.append((field_id.replace("_", " ").title(), fmt(value)))
+
     table = Table(
         title=f"Extracted: {phase_name}",
         show_header=True,
@@ -105,32 +206,8 @@ def _show_extraction_table(extracted: dict, phase_name: str):
     table.add_column("Field", style="bold cyan", min_width=20)
     table.add_column("Value", min_width=40)
 
-    for field_id, value in extracted.items():
-        if field_id.startswith("_"):
-            continue
-
-        if isinstance(value, list):
-            if value:
-                display = "\n".join(
-                    f"\u2022 {item}"
-                    if not isinstance(item, dict)
-                    else "\u2022 " + ", ".join(f"{k}: {v}" for k, v in item.items())
-                    for item in value[:5]
-                )
-                if len(value) > 5:
-                    display += f"\n  [dim]... and {len(value) - 5} more[/dim]"
-            else:
-                display = "[dim](none)[/dim]"
-        elif isinstance(value, dict):
-            display = "\n".join(f"{k}: {v}" for k, v in list(value.items())[:5])
-            if len(value) > 5:
-                display += f"\n[dim]... and {len(value) - 5} more[/dim]"
-        else:
-            display = str(value)[:200]
-            if len(str(value)) > 200:
-                display += "..."
-
-        table.add_row(field_id.replace("_", " ").title(), display)
+    for label, display in rows:
+        table.add_row(label, display)
 
     console.print(table)
 
@@ -138,14 +215,16 @@ def _show_extraction_table(extracted: dict, phase_name: str):
 # ── Action handlers ──
 
 
-def _action_browse(session: Session, template):
-    """Browse phase data: transcripts and extracted fields."""
+def _action_browse(session: Session, template, phases: list[dict]) -> bool:
+    """Browse phase data: transcripts and extracted fields. Never changes the session."""
+    from rich.panel import Panel
+
     console.print("\n  [bold]Browse Phase Data[/bold]\n")
-    phase_id = _phase_picker(session, template, prompt_text="View phase")
+    phase_id = _phase_picker(phases, prompt_text="View phase")
     if not phase_id:
-        return
+        return False
 
-    pt = next(p for p in template.phases if p.id == phase_id)
+    pt = template.phases_by_id[phase_id]
     ps = session.phases[phase_id]
 
     section_divider(pt.name)
@@ -159,11 +238,12 @@ def _action_browse(session: Session, template):
     console.print()
 
     # Show transcript preview
-    transcript = session.get_transcript(phase_id)
+    transcript = session.get_transcript(phase_id, max_chars=800)
     if transcript:
         preview = transcript[:800]
-        if len(transcript) > 800:
-            preview += f"\n\n[dim]... ({len(transcript):,} total chars)[/dim]"
+        if len(transcript) > 800 and ps.transcript_file:
+            size = (session.phase_dir(phase_id) / ps.transcript_file).stat().st_size
+            preview += f"\n\n[dim]... ({size:,} bytes total)[/dim]"
         console.print(
             Panel(
                 preview,
@@ -181,29 +261,31 @@ def _action_browse(session: Session, template):
         _show_extraction_table(extracted, pt.name)
     else:
         console.print("\n  [dim]No extracted data yet.[/dim]")
+    return False
 
 
-def _action_re_extract(session_name: str, session: Session, template):
-    """Re-run AI extraction on a phase."""
+def _action_re_extract(session_name: str, session: Session, template, phases: list[dict]) -> bool:
+    """Re-run AI extraction on a phase. Returns True if session data was changed."""
+    from rich.panel import Panel
+
     console.print("\n  [bold]Re-Extract Phase[/bold]\n")
 
     phase_id = _phase_picker(
-        session,
-        template,
+        phases,
         filter_status=["transcribed", "extracted", "complete"],
         prompt_text="Re-extract phase",
     )
     if not phase_id:
         console.print("  [dim]No phases with transcripts available.[/dim]")
-        return
+        return False
 
-    pt = next(p for p in template.phases if p.id == phase_id)
+    pt = template.phases_by_id[phase_id]
 
     # Show current transcript
-    transcript = session.get_transcript(phase_id)
+    transcript = session.get_transcript(phase_id, max_chars=600)
     if not transcript:
         console.print(f"  [red]No transcript for {pt.name}.[/red]")
-        return
+        return False
 
     console.print(
         Panel(
@@ -213,6 +295,8 @@ def _action_re_extract(session_name: str, session: Session, template):
         )
     )
 
+    changed = False
+
     # Option to replace transcript
     if Confirm.ask("  Edit transcript before re-extracting?", default=False):
         console.print("\n  [bold]Enter replacement text.[/bold]")
@@ -220,105 +304,117 @@ def _action_re_extract(session_name: str, session: Session, template):
             "  [dim]Type or paste your text. Enter an empty line followed by 'END' to finish.[/dim]\n"
         )
 
-        lines = []
-        while True:
-            try:
-                line = input()
-                if line.strip() == "END":
-                    break
-                lines.append(line)
-            except EOFError:
-                break
-
-        new_text = "\n".join(lines)
+        new_text = read_until_end()
         if new_text.strip():
             # Save the new transcript via capture_text
-            _extraction_svc.capture_text(session_name, phase_id, new_text)
+            _get_extraction_svc().capture_text(session_name, phase_id, new_text)
+            changed = True
             console.print(f"  [green]Transcript updated ({len(new_text)} chars)[/green]")
 
     # Show existing extraction for comparison
     old_extracted = session.get_extracted(phase_id)
 
     if not Confirm.ask("  Run extraction now?", default=True):
-        return
+        return changed
 
     if not pt.extract:
         console.print(f"  [yellow]{pt.name} has no extraction fields defined.[/yellow]")
-        return
+        return changed
 
     # Run extraction via service
     try:
         with console.status(f"[bold]Extracting {len(pt.extract)} fields...[/bold]"):
-            result = _extraction_svc.extract_phase(session_name, phase_id)
+            result = _get_extraction_svc().extract_phase(session_name, phase_id)
     except Exception as e:
         console.print(f"  [red]Extraction error: {e}[/red]")
-        return
+        return changed
 
     # Show results
     console.print()
     _show_extraction_table(result.fields, f"{pt.name} (new)")
 
     if old_extracted:
-        changes = []
-        for key in set(list(result.fields.keys()) + list(old_extracted.keys())):
-            if key.startswith("_"):
-                continue
-            if old_extracted.get(key) != result.fields.get(key):
-                changes.append(key)
+        new_fields = result.fields
+        changes = [
+            key
+            for key in new_fields.keys() | old_extracted.keys()
+            if not key.startswith("_") and old_extracted.get(key) != new_fields.get(key)
+        ]
 
         if changes:
             console.print(f"\n  [yellow]Changed fields: {', '.join(changes)}[/yellow]")
         else:
             console.print("\n  [dim]No changes from previous extraction.[/dim]")
+    return True
 
 
-def _action_refine(session: Session, template):
-    """Edit specific extracted field values."""
+def _action_refine(session: Session, template, phases: list[dict]) -> bool:
+    """Edit specific extracted field values. Returns True if changes were saved."""
     console.print("\n  [bold]Refine Extracted Data[/bold]\n")
 
     phase_id = _phase_picker(
-        session,
-        template,
+        phases,
         filter_status=["extracted", "complete"],
         prompt_text="Refine phase",
     )
     if not phase_id:
         console.print("  [dim]No phases with extracted data.[/dim]")
-        return
+        return False
 
-    pt = next(p for p in template.phases if p.id == phase_id)
+    pt = template.phases_by_id[phase_id]
     extracted = session.get_extracted(phase_id)
     if not extracted:
         console.print(f"  [dim]No extracted data for {pt.name}.[/dim]")
-        return
+        return False
 
     # Show fields numbered
     fields = [(k, v) for k, v in extracted.items() if not k.startswith("_")]
     if not fields:
         console.print("  [dim]No editable fields.[/dim]")
-        return
+        return False
 
+    # Only one page of fields is rendered per prompt, however many were extracted
+    page = 0
+    pages = -(-len(fields) // _REFINE_PAGE_SIZE)
     while True:
-        console.print(f"\n  [bold]{pt.name} - Fields:[/bold]\n")
-        for i, (key, value) in enumerate(fields, 1):
+        start = page * _REFINE_PAGE_SIZE
+        shown = fields[start : start + _REFINE_PAGE_SIZE]
+        heading = f"\n  [bold]{pt.name} - Fields:[/bold]"
+        if pages > 1:
+            heading += f" [dim](page {page + 1}/{pages})[/dim]"
+        console.print(heading + "\n")
+        for i, (key, value) in enumerate(shown, start + 1):
             if isinstance(value, list):
                 display = f"[dim]({len(value)} items)[/dim]"
             elif isinstance(value, dict):
                 display = f"[dim]({len(value)} keys)[/dim]"
             else:
-                display = str(value)[:60]
-                if len(str(value)) > 60:
-                    display += "..."
+                text = str(value)
+                display = text[:60] + "..." if len(text) > 60 else text
             console.print(f"    [bold cyan]{i}[/bold cyan]  {key}: {display}")
 
+        nav = []
+        if page + 1 < pages:
+            console.print("    [bold cyan]n[/bold cyan]  Next page")
+            nav.append("n")
+        if page > 0:
+            console.print("    [bold cyan]p[/bold cyan]  Previous page")
+            nav.append("p")
         console.print("    [bold cyan]q[/bold cyan]  Done editing")
         console.print()
 
-        choice = Prompt.ask(
-            "  Edit field", choices=[str(i) for i in range(1, len(fields) + 1)] + ["q"]
+        choice = ChoicePrompt.ask(
+            "  Edit field",
+            choices=[str(i) for i in range(start + 1, start + len(shown) + 1)] + nav + ["q"],
         )
         if choice == "q":
             break
+        if choice == "n":
+            page += 1
+            continue
+        if choice == "p":
+            page -= 1
+            continue
 
         idx = int(choice) - 1
         key, value = fields[idx]
@@ -345,7 +441,7 @@ def _action_refine(session: Session, template):
                         else ", ".join(f"{k}: {v}" for k, v in item.items())
                     )
                     console.print(f"    {i}. {display}")
-                rm_idx = Prompt.ask(
+                rm_idx = ChoicePrompt.ask(
                     "  Remove #", choices=[str(i) for i in range(1, len(value) + 1)]
                 )
                 value.pop(int(rm_idx) - 1)
@@ -381,21 +477,23 @@ def _action_refine(session: Session, template):
 
     # Save
     if Confirm.ask("  Save changes?", default=True):
-        dest = session.phase_dir(phase_id) / "extracted.yaml"
-        with open(dest, "w") as f:
-            yaml.dump(extracted, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        session.write_extracted(phase_id, extracted)
+        # Phase state is unchanged; this only records the edit in updated_at
         session.save()
         console.print("  [green]Changes saved.[/green]")
-    else:
-        console.print("  [dim]Changes discarded.[/dim]")
+        return True
+    console.print("  [dim]Changes discarded.[/dim]")
+    return False
+
 
+def _action_rebuild(session_name: str, session: Session) -> bool:
+    """Regenerate all outputs. Writes output files only, never session state."""
+    from rich.panel import Panel
 
-def _action_rebuild(session_name: str, session: Session):
-    """Regenerate all outputs."""
     console.print("\n  [bold]Rebuild Outputs[/bold]\n")
 
     try:
-        result = _build_svc.generate_outputs(session_name, "all")
+        result = _get_build_svc().generate_outputs(session_name, "all")
         for label, path in result.generated_files:
             console.print(f"  [bold]{label}[/bold]: {path}")
     except (FileNotFoundError, ValueError) as e:
@@ -405,7 +503,7 @@ def _action_rebuild(session_name: str, session: Session):
     if Confirm.ask("  Generate AI summary?", default=True):
         try:
             with console.status("[bold]Generating AI summary...[/bold]"):
-                summary, path = _build_svc.generate_summary(session_name)
+                summary, path = _get_build_svc().generate_summary(session_name)
             console.print(
                 Panel(
                     summary[:500] + "..." if len(summary) > 500 else summary,
@@ -418,10 +516,11 @@ def _action_rebuild(session_name: str, session: Session):
             console.print(f"  [red]{e}[/red]")
 
     console.print("\n  [green]Rebuild complete.[/green]")
+    return False
 
 
-def _action_import(session_name: str):
-    """Import a multi-phase document."""
+def _action_import(session_name: str) -> bool:
+    """Import a multi-phase document. Returns True if an import was attempted."""
     console.print("\n  [bold]Import Document[/bold]\n")
 
     file_path = Prompt.ask("  File path")
@@ -429,7 +528,7 @@ def _action_import(session_name: str):
 
     if not path.exists():
         console.print(f"  [red]File not found: {path}[/red]")
-        return
+        return False
 
     from sift.commands.import_cmd import import_document
 
@@ -437,6 +536,7 @@ def _action_import(session_name: str):
         import_document(session_name, path, auto=False)
     except SystemExit:
         pass
+    return True
 
 
 # ── Main workspace loop ──
@@ -454,11 +554,20 @@ def open_workspace(session_name: str):
 
         raise typer.Exit(1)
 
-    tmpl = s.get_template()
-
+    changed = True
+    shown_state = None
     while True:
-        console.print()
-        _show_workspace_header(s, tmpl)
+        # Session and phase rows are reloaded only after an action reported a change
+        if changed:
+            tmpl = s.get_template()
+            phases = _build_phase_list(s, tmpl)
+
+        # The header is redrawn only when some phase's status differs from the last one shown
+        state = tuple(p["status"] for p in phases)
+        if state != shown_state:
+            console.print()
+            _show_workspace_header(s, tmpl, phases)
+            shown_state = state
 
         console.print("  What would you like to do?\n")
         console.print(
@@ -483,22 +592,18 @@ def open_workspace(session_name: str):
             console.print("\n  [dim]Workspace closed.[/dim]")
             break
 
-        # Reload session to pick up any changes
-        s = Session.load(session_name)
-        tmpl = s.get_template()
-
+        changed = False
         if choice == "1":
-            _action_browse(s, tmpl)
+            changed = _action_browse(s, tmpl, phases)
         elif choice == "2":
-            _action_re_extract(session_name, s, tmpl)
-            s = Session.load(session_name)
+            changed = _action_re_extract(session_name, s, tmpl, phases)
         elif choice == "3":
-            _action_refine(s, tmpl)
-            s = Session.load(session_name)
+            changed = _action_refine(s, tmpl, phases)
         elif choice == "4":
-            _action_rebuild(session_name, s)
+            changed = _action_rebuild(session_name, s)
         elif choice == "5":
-            _action_import(session_name)
-            s = Session.load(session_name)
+            changed = _action_import(session_name)
 
         section_divider()
+        if changed:
+            s = Session.load(session_name)
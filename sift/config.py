@@ -5,18 +5,20 @@ and sift.core.secrets for API key management. It maintains backward-compatible
 exports used by existing code.
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
-# Try to load .env file if it exists
-try:
-    from dotenv import load_dotenv
+# Load the project's .env file if it exists. The file check comes first so the
+# usual case (no .env) costs one stat and never imports dotenv.
+_ENV_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env")
+if os.path.isfile(_ENV_PATH):
+    try:
+        from dotenv import load_dotenv
 
-    project_root = Path(__file__).parent.parent
-    env_file = project_root / ".env"
-    if env_file.exists():
-        load_dotenv(env_file)
-except ImportError:
-    pass
+        load_dotenv(_ENV_PATH)
+    except ImportError:
+        pass
 
 
 # Map provider names to their env var for API keys (kept for backward compat)
@@ -27,6 +29,31 @@ PROVIDER_KEY_MAP = {
 }
 
 
+# Environment and config sources are effectively fixed for the life of a
+# run, so resolved values are memoised; Config.invalidate() drops them.
+
+
+@lru_cache(maxsize=1)
+def _ai_provider() -> str:
+    from sift.core.config_service import get_config_service
+
+    return get_config_service().get_provider_name()
+
+
+@lru_cache(maxsize=8)
+def _provider_key(provider: str) -> str | None:
+    from sift.core.secrets import get_key
+
+    return get_key(provider)
+
+
+@lru_cache(maxsize=1)
+def _sift_home() -> Path:
+    from sift.core.config_service import get_config_service
+
+    return get_config_service().get_data_dir()
+
+
 class Config:
     """Central configuration for sift.
 
@@ -37,38 +64,34 @@ class Config:
     @staticmethod
     def get_ai_provider() -> str:
         """Get the active AI provider name."""
-        from sift.core.config_service import get_config_service
-
-        return get_config_service().get_provider_name()
+        return _ai_provider()
 
     @staticmethod
     def get_anthropic_api_key() -> str | None:
         """Get Anthropic API key."""
-        from sift.core.secrets import get_key
-
-        return get_key("anthropic")
+        return _provider_key("anthropic")
 
     @staticmethod
     def get_google_api_key() -> str | None:
         """Get Google/Gemini API key."""
-        from sift.core.secrets import get_key
-
-        return get_key("gemini")
+        return _provider_key("gemini")
 
     @staticmethod
     def get_provider_api_key(provider: str = None) -> str | None:
         """Get the API key for the specified or current provider."""
-        from sift.core.secrets import get_key
-
-        provider = provider or Config.get_ai_provider()
-        return get_key(provider)
+        return _provider_key(provider or _ai_provider())
 
     @staticmethod
     def get_sift_home() -> Path:
         """Get the base directory for all sift data."""
-        from sift.core.config_service import get_config_service
+        return _sift_home()
 
-        return get_config_service().get_data_dir()
+    @staticmethod
+    def invalidate() -> None:
+        """Drop memoised provider, key and data-dir lookups."""
+        _ai_provider.cache_clear()
+        _provider_key.cache_clear()
+        _sift_home.cache_clear()
 
     @staticmethod
     def require_api_key() -> str:
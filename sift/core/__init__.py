@@ -88,7 +88,7 @@ class SessionDetail:
     next_action_phase: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CaptureResult:
     """Result of capturing content for a phase."""
 
@@ -100,6 +100,8 @@ class CaptureResult:
     pdf_stats: dict | None = None
     multi_phase_detected: bool = False
     appended: bool = False
+    had_content: bool = False  # phase was past "pending" before this capture
+    cancelled: bool = False  # on_existing callback declined to overwrite
 
 
 @dataclass
@@ -8,7 +8,10 @@ Bridges project analysis (sift analyze) with the session workflow by:
 
 from __future__ import annotations
 
+import heapq
 import logging
+from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
 
 import yaml
@@ -19,6 +22,7 @@ from sift.core import AnalysisSessionResult
 from sift.core.extraction_service import ExtractionService
 from sift.core.session_service import SessionService
 from sift.core.template_service import TemplateService
+from sift.io_utils import SafeDumper, SafeLoader
 from sift.models import Session, ensure_dirs
 from sift.providers.base import AIProvider
 
@@ -31,9 +35,51 @@ _QUALITY_KEYWORDS = {"quality", "complexity", "hotspot", "review"}
 _CONTEXT_KEYWORDS = {"current", "state", "background", "describe", "inventory", "infrastructure"}
 _WORKFLOW_KEYWORDS = {"workflow", "process", "pipeline", "flow", "steps", "deployment"}
 
+# Checked in order; a phase takes the first category whose keywords it shares and
+# whose required ProjectStructure attribute (if any) is non-empty.
+# Entries are (keywords, transcript kind, required attribute).
+_CATEGORY_TABLE = (
+    (frozenset(_ARCHITECTURE_KEYWORDS), "analysis", None),
+    (frozenset(_DEPENDENCY_KEYWORDS), "dependency", "dependencies"),
+    (frozenset(_QUALITY_KEYWORDS), "quality", "file_analyses"),
+    (frozenset(_CONTEXT_KEYWORDS | _WORKFLOW_KEYWORDS), "analysis", None),
+)
 
-def serialize_analysis_text(structure: ProjectStructure) -> str:
+# Phase IDs and names are split into words on whitespace, hyphens and underscores
+_WORD_SEPARATORS = str.maketrans("-_", "  ")
+
+# Serialized analyses list at most this many entry points and dependencies
+_MAX_ENTRY_POINTS = 10
+_MAX_DEPENDENCIES = 30
+
+
+@dataclass(frozen=True)
+class _AnalysisView:
+    """Bounded slices of a ProjectStructure shared by the text and dict serializers.
+
+    Flows that produce both a transcript and stored context build this once
+    and pass it to each serializer, so the lists are sliced and walked once.
+    """
+
+    entry_points: list[str]
+    dependencies: list[tuple[str, str, str]]  # (name, version, source)
+    more_dependencies: int
+
+
+def _analysis_view(structure: ProjectStructure) -> _AnalysisView:
+    deps = structure.dependencies
+    return _AnalysisView(
+        entry_points=structure.entry_points[:_MAX_ENTRY_POINTS],
+        dependencies=[(d.name, d.version, d.source) for d in deps[:_MAX_DEPENDENCIES]],
+        more_dependencies=max(0, len(deps) - _MAX_DEPENDENCIES),
+    )
+
+
+def serialize_analysis_text(
+    structure: ProjectStructure, *, view: _AnalysisView | None = None
+) -> str:
     """Convert ProjectStructure to human-readable text for use as a phase transcript."""
+    view = view or _analysis_view(structure)
     parts = [
         f"# Project Analysis: {structure.name}",
         "",
@@ -52,16 +98,16 @@ def serialize_analysis_text(structure: ProjectStructure) -> str:
     if structure.frameworks_detected:
         parts.append(f"- Frameworks detected: {', '.join(structure.frameworks_detected)}")
 
-    if structure.entry_points:
-        parts.append(f"- Entry points: {', '.join(structure.entry_points[:10])}")
+    if view.entry_points:
+        parts.append(f"- Entry points: {', '.join(view.entry_points)}")
 
-    if structure.dependencies:
+    if view.dependencies:
         dep_section = ["", "## Dependencies"]
-        for dep in structure.dependencies[:30]:
-            version_str = f" ({dep.version})" if dep.version else ""
-            dep_section.append(f"- {dep.name}{version_str} [from {dep.source}]")
-        if len(structure.dependencies) > 30:
-            dep_section.append(f"  ... and {len(structure.dependencies) - 30} more")
+        for name, version, source in view.dependencies:
+            version_str = f" ({version})" if version else ""
+            dep_section.append(f"- {name}{version_str} [from {source}]")
+        if view.more_dependencies:
+            dep_section.append(f"  ... and {view.more_dependencies} more")
         parts.extend(dep_section)
 
     if structure.directory_tree:
@@ -71,11 +117,11 @@ def serialize_analysis_text(structure: ProjectStructure) -> str:
         parts.extend(["", "## Architecture Summary", structure.architecture_summary])
 
     # Top complexity files
-    top_complex = sorted(
-        [f for f in structure.file_analyses if f.complexity_score > 0],
-        key=lambda f: f.complexity_score,
-        reverse=True,
-    )[:10]
+    top_complex = heapq.nlargest(
+        10,
+        (f for f in structure.file_analyses if f.complexity_score > 0),
+        key=attrgetter("complexity_score"),
+    )
     if top_complex:
         parts.extend(["", "## Complexity Hotspots"])
         for fa in top_complex:
@@ -91,8 +137,11 @@ def serialize_analysis_text(structure: ProjectStructure) -> str:
     return "\n".join(parts)
 
 
-def serialize_analysis_context(structure: ProjectStructure) -> dict:
+def serialize_analysis_context(
+    structure: ProjectStructure, *, view: _AnalysisView | None = None
+) -> dict:
     """Convert ProjectStructure to a structured dict for storage and context injection."""
+    view = view or _analysis_view(structure)
     return {
         "project_name": structure.name,
         "root_path": str(structure.root_path),
@@ -100,10 +149,10 @@ def serialize_analysis_context(structure: ProjectStructure) -> dict:
         "total_files": structure.total_files,
         "total_lines": structure.total_lines,
         "frameworks": structure.frameworks_detected,
-        "entry_points": structure.entry_points[:10],
+        "entry_points": list(view.entry_points),
         "dependencies": [
-            {"name": d.name, "version": d.version, "source": d.source}
-            for d in structure.dependencies[:30]
+            {"name": name, "version": version, "source": source}
+            for name, version, source in view.dependencies
         ],
         "directory_tree": structure.directory_tree,
         "architecture_summary": structure.architecture_summary or "",
@@ -179,10 +228,13 @@ class AnalysisService:
         detail = self._session_svc.create_session(tmpl_path.stem, name=session_name)
 
         # Populate matching phases (_populate_matching_phases includes fallback to first phase)
-        populated_phases = self._populate_matching_phases(detail.name, structure)
+        view = _analysis_view(structure)
+        populated_phases = self._populate_matching_phases(detail.name, structure, view=view)
 
         # Store analysis context alongside session
-        analysis_path = self._store_analysis(detail.name, serialize_analysis_context(structure))
+        analysis_path = self._store_analysis(
+            detail.name, serialize_analysis_context(structure, view=view)
+        )
 
         # Refresh detail to reflect populated phase
         detail = self._session_svc.get_session_status(detail.name)
@@ -222,10 +274,13 @@ class AnalysisService:
         structure = self._analyzer.analyze(project_path, provider=provider)
 
         # Auto-populate matching phases
-        populated_phases = self._populate_matching_phases(detail.name, structure)
+        view = _analysis_view(structure)
+        populated_phases = self._populate_matching_phases(detail.name, structure, view=view)
 
         # Store analysis context
-        analysis_path = self._store_analysis(detail.name, serialize_analysis_context(structure))
+        analysis_path = self._store_analysis(
+            detail.name, serialize_analysis_context(structure, view=view)
+        )
 
         detail = self._session_svc.get_session_status(detail.name)
 
@@ -255,7 +310,8 @@ class AnalysisService:
         """
         project_path = project_path.resolve()
         structure = self._analyzer.analyze(project_path, provider=provider)
-        analysis_text = serialize_analysis_text(structure)
+        view = _analysis_view(structure)
+        analysis_text = serialize_analysis_text(structure, view=view)
 
         self._extraction_svc.capture_text(session_name, phase_id, analysis_text, append=append)
 
@@ -263,7 +319,7 @@ class AnalysisService:
         s = Session.load(session_name)
         analysis_path = s.dir / "analysis.yaml"
         if not analysis_path.exists():
-            self._store_analysis(session_name, serialize_analysis_context(structure))
+            self._store_analysis(session_name, serialize_analysis_context(structure, view=view))
 
     def get_analysis_context(self, session_name: str) -> dict | None:
         """Load stored project analysis context for a session.
@@ -275,7 +331,7 @@ class AnalysisService:
         analysis_path = s.dir / "analysis.yaml"
         if analysis_path.exists():
             with open(analysis_path) as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=SafeLoader)
         return None
 
     def _store_analysis(self, session_name: str, context: dict) -> Path:
@@ -283,12 +339,15 @@ class AnalysisService:
         s = Session.load(session_name)
         analysis_path = s.dir / "analysis.yaml"
         with open(analysis_path, "w") as f:
-            yaml.dump(context, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(context, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
         logger.info("Analysis context stored at %s", analysis_path)
         return analysis_path
 
     def _populate_matching_phases(
-        self, session_name: str, structure: ProjectStructure
+        self,
+        session_name: str,
+        structure: ProjectStructure,
+        view: _AnalysisView | None = None,
     ) -> list[str]:
         """Auto-populate phases whose IDs/names match analysis categories.
 
@@ -297,7 +356,20 @@ class AnalysisService:
         """
         s = Session.load(session_name)
         tmpl = s.get_template()
-        analysis_text = serialize_analysis_text(structure)
+        # Each transcript text is built at most once, on first use, however many
+        # phases match its category
+        texts: dict[str, str] = {}
+
+        def text_for(kind: str) -> str:
+            if kind not in texts:
+                if kind == "dependency":
+                    texts[kind] = self._build_dependency_text(structure)
+                elif kind == "quality":
+                    texts[kind] = self._build_quality_text(structure)
+                else:
+                    texts[kind] = serialize_analysis_text(structure, view=view)
+            return texts[kind]
+
         populated = []
 
         for pt in tmpl.phases:
@@ -305,30 +377,24 @@ class AnalysisService:
             if not ps or ps.status != "pending":
                 continue
 
-            phase_words = set(pt.id.lower().replace("-", " ").replace("_", " ").split())
-            phase_words |= set(pt.name.lower().replace("-", " ").replace("_", " ").split())
-
-            if phase_words & _ARCHITECTURE_KEYWORDS:
-                self._extraction_svc.capture_text(session_name, pt.id, analysis_text)
-                populated.append(pt.id)
-            elif phase_words & _DEPENDENCY_KEYWORDS and structure.dependencies:
-                dep_text = self._build_dependency_text(structure)
-                self._extraction_svc.capture_text(session_name, pt.id, dep_text)
-                populated.append(pt.id)
-            elif phase_words & _QUALITY_KEYWORDS and structure.file_analyses:
-                quality_text = self._build_quality_text(structure)
-                self._extraction_svc.capture_text(session_name, pt.id, quality_text)
-                populated.append(pt.id)
-            elif phase_words & (_CONTEXT_KEYWORDS | _WORKFLOW_KEYWORDS):
-                self._extraction_svc.capture_text(session_name, pt.id, analysis_text)
+            phase_words = frozenset(
+                f"{pt.id} {pt.name}".lower().translate(_WORD_SEPARATORS).split()
+            )
+            for keywords, kind, required in _CATEGORY_TABLE:
+                if phase_words.isdisjoint(keywords):
+                    continue
+                if required and not getattr(structure, required):
+                    continue
+                self._extraction_svc.capture_text(session_name, pt.id, text_for(kind))
                 populated.append(pt.id)
+                break
 
         # Fallback: if no keywords matched, populate the first pending phase
         if not populated:
             for pt in tmpl.phases:
                 ps = s.phases.get(pt.id)
                 if ps and ps.status == "pending":
-                    self._extraction_svc.capture_text(session_name, pt.id, analysis_text)
+                    self._extraction_svc.capture_text(session_name, pt.id, text_for("analysis"))
                     populated.append(pt.id)
                     break
 
@@ -358,11 +424,11 @@ class AnalysisService:
             "",
             "## Complexity Hotspots",
         ]
-        top = sorted(
-            [f for f in structure.file_analyses if f.complexity_score > 0],
-            key=lambda f: f.complexity_score,
-            reverse=True,
-        )[:15]
+        top = heapq.nlargest(
+            15,
+            (f for f in structure.file_analyses if f.complexity_score > 0),
+            key=attrgetter("complexity_score"),
+        )
         for fa in top:
             try:
                 rel = str(fa.path.relative_to(structure.root_path))
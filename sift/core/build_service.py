@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import io
 import logging
 from pathlib import Path
 
 import yaml
 
 from sift.core import BuildResult
+from sift.io_utils import SafeDumper
 from sift.models import Session, ensure_dirs
 
 logger = logging.getLogger("sift.core.build")
@@ -36,17 +38,8 @@ class BuildService:
         output_dir = s.dir / "outputs"
         output_dir.mkdir(exist_ok=True)
 
-        # Collect all extracted data
-        all_data = {}
-        all_transcripts = {}
-
-        for pt in tmpl.phases:
-            extracted = s.get_extracted(pt.id)
-            if extracted:
-                all_data[pt.id] = extracted
-            transcript = s.get_transcript(pt.id)
-            if transcript:
-                all_transcripts[pt.id] = transcript
+        # Collect all extracted data; pending phases cost no file access
+        all_data, all_transcripts = s.load_all_artifacts(pt.id for pt in tmpl.phases)
 
         if not all_data:
             from sift.errors import ExtractionError
@@ -65,6 +58,7 @@ class BuildService:
                 yaml.dump(
                     config,
                     f,
+                    Dumper=SafeDumper,
                     default_flow_style=False,
                     sort_keys=False,
                     allow_unicode=True,
@@ -84,6 +78,7 @@ class BuildService:
                 yaml.dump(
                     consolidated,
                     f,
+                    Dumper=SafeDumper,
                     default_flow_style=False,
                     sort_keys=False,
                     allow_unicode=True,
@@ -175,25 +170,27 @@ class BuildService:
 
     def _build_markdown(self, s: Session, tmpl, all_data: dict, all_transcripts: dict) -> str:
         """Build a markdown summary document."""
-        lines = [
-            f"# {tmpl.name}: Session Summary",
-            "",
-            f"**Session:** {s.name}  ",
-            f"**Template:** {s.template_name}  ",
-            f"**Created:** {s.created_at[:16]}  ",
-            f"**Status:** {s.status}",
-            "",
-            "---",
-            "",
-        ]
+        # Written into one buffer; every line after the header carries its own
+        # leading newline, so no list of fragments is built and joined
+        buf = io.StringIO()
+        write = buf.write
+        write(
+            f"# {tmpl.name}: Session Summary\n"
+            "\n"
+            f"**Session:** {s.name}  \n"
+            f"**Template:** {s.template_name}  \n"
+            f"**Created:** {s.created_at[:16]}  \n"
+            f"**Status:** {s.status}\n"
+            "\n"
+            "---\n"
+        )
 
         for pt in tmpl.phases:
             ps = s.phases.get(pt.id)
             if not ps or ps.status == "pending":
                 continue
 
-            lines.append(f"## {pt.name}")
-            lines.append("")
+            write(f"\n## {pt.name}\n")
 
             extracted = all_data.get(pt.id, {})
             if extracted:
@@ -201,43 +198,38 @@ class BuildService:
                     if field_id.startswith("_"):
                         continue
 
-                    lines.append(f"### {field_id.replace('_', ' ').title()}")
-                    lines.append("")
+                    write(f"\n### {field_id.replace('_', ' ').title()}\n")
 
                     if isinstance(value, list):
                         for item in value:
                             if isinstance(item, dict):
                                 for k, v in item.items():
-                                    lines.append(f"- **{k}**: {v}")
+                                    write(f"\n- **{k}**: {v}")
                             else:
-                                lines.append(f"- {item}")
+                                write(f"\n- {item}")
                     elif isinstance(value, dict):
                         for k, v in value.items():
-                            lines.append(f"- **{k}**: {v}")
+                            write(f"\n- **{k}**: {v}")
                     else:
-                        lines.append(str(value))
+                        write(f"\n{value}")
 
-                    lines.append("")
+                    write("\n")
 
-            lines.append("---")
-            lines.append("")
+            write("\n---\n")
 
         if all_transcripts:
-            lines.append("## Raw Transcripts")
-            lines.append("")
+            write("\n## Raw Transcripts\n")
+            phases_by_id = tmpl.phases_by_id
             for phase_id, transcript in all_transcripts.items():
-                pt = next((p for p in tmpl.phases if p.id == phase_id), None)
+                pt = phases_by_id.get(phase_id)
                 name = pt.name if pt else phase_id
-                lines.append(f"### {name}")
-                lines.append("")
-                lines.append("```")
-                lines.append(transcript[:3000])
+                write(f"\n### {name}\n\n```\n")
+                write(transcript[:3000])
                 if len(transcript) > 3000:
-                    lines.append(f"\n... [truncated, {len(transcript)} total chars]")
-                lines.append("```")
-                lines.append("")
+                    write(f"\n\n... [truncated, {len(transcript)} total chars]")
+                write("\n```\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _build_consolidated(self, s: Session, tmpl, all_data: dict) -> dict:
         """Build a flat consolidated view of all extracted data."""
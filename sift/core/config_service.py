@@ -280,8 +280,9 @@ class ConfigService:
         data = _read_toml(path)
         _set_nested(data, dotted_key, value)
         _write_toml(data, path)
-        # Invalidate cache
+        # Invalidate cache, including Config's memoised lookups
         self._resolved = None
+        _invalidate_config_lookups()
         logger.info("Set %s = %s in %s", dotted_key, value, path)
 
     def init_project_config(self) -> Path:
@@ -348,3 +349,11 @@ def reset_config_service() -> None:
     """Reset the global config service (useful for testing)."""
     global _config_service
     _config_service = None
+    _invalidate_config_lookups()
+
+
+def _invalidate_config_lookups() -> None:
+    """Drop the provider/key/data-dir values sift.config.Config memoises."""
+    from sift.config import Config
+
+    Config.invalidate()
@@ -31,7 +31,15 @@ from pathlib import Path
 
 import yaml
 
-from sift.models import SESSIONS_DIR, TEMPLATES_DIR, Session, SessionTemplate, ensure_dirs
+from sift.io_utils import fastcopy
+from sift.models import (
+    SESSIONS_DIR,
+    TEMPLATES_DIR,
+    Session,
+    SessionTemplate,
+    ensure_dirs,
+    remember_template,
+)
 
 logger = logging.getLogger("sift.core.export")
 
@@ -181,7 +189,8 @@ class ExportService:
             raise ValueError(f"Template '{slug}' already exists. Use --overwrite to replace.")
 
         TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source_path, dest_path)
+        fastcopy(source_path, dest_path)
+        remember_template(dest_path, template)
         logger.info("Imported template '%s' to %s", template.name, dest_path)
         return dest_path
 
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
-import shutil
+import os
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 
@@ -11,25 +14,51 @@ import yaml
 
 from sift.core import CaptureResult, ExtractionResult, TranscribeResult
 from sift.errors import CaptureError, ExtractionError, PhaseNotFoundError
+from sift.io_utils import SafeDumper, SafeLoader, fastcopy, link_or_copy
 from sift.models import Session, ensure_dirs
 
 logger = logging.getLogger("sift.core.extraction")
 
 # File type classifications
-AUDIO_EXTENSIONS = {".mp3", ".wav", ".webm", ".m4a", ".ogg", ".flac", ".mp4", ".aac"}
-TEXT_EXTENSIONS = {".txt", ".md", ".text"}
-PDF_EXTENSIONS = {".pdf"}
+AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".webm", ".m4a", ".ogg", ".flac", ".mp4", ".aac"})
+TEXT_EXTENSIONS = frozenset({".txt", ".md", ".text"})
+PDF_EXTENSIONS = frozenset({".pdf"})
+_SUPPORTED_LIST = ", ".join(sorted(AUDIO_EXTENSIONS | TEXT_EXTENSIONS | PDF_EXTENSIONS))
 
 # File size limits (bytes)
 MAX_AUDIO_SIZE = 50 * 1024 * 1024  # 50MB
 MAX_TEXT_SIZE = 20 * 1024 * 1024   # 20MB
 
 
+def _resolve_existing(
+    had_content: bool, append: bool, on_existing: Callable[[], str] | None
+) -> bool | None:
+    """Decide the append flag for a capture, asking on_existing if needed.
+
+    Returns None when the callback cancels the capture.
+    """
+    if not had_content or append or on_existing is None:
+        return append
+    action = on_existing()
+    if action == "cancel":
+        return None
+    return action == "append"
+
+
 class ExtractionService:
     """Handles capture, transcription, and structured data extraction."""
 
+    def __init__(self) -> None:
+        # extracted.yaml path -> ((mtime_ns, size, inode), dumped context YAML or None)
+        self._context_cache: dict[Path, tuple[tuple[int, int, int], str | None]] = {}
+
     def capture_file(
-        self, session_name: str, phase_id: str, file_path: Path, append: bool = False
+        self,
+        session_name: str,
+        phase_id: str,
+        file_path: Path,
+        append: bool = False,
+        on_existing: Callable[[], str] | None = None,
     ) -> CaptureResult:
         """Capture a file (audio, text, or PDF) for a session phase.
 
@@ -37,6 +66,9 @@ class ExtractionService:
             append: If True and a transcript already exists, append new content
                     instead of replacing it. Resets status to "transcribed" if
                     previously extracted.
+            on_existing: Called when the phase already has content and append is
+                    False. Returns "append", "replace", or "cancel"; on "cancel"
+                    nothing is written and the result has ``cancelled=True``.
 
         Raises:
             SessionNotFoundError: If session not found.
@@ -47,7 +79,7 @@ class ExtractionService:
         s = Session.load(session_name)
         tmpl = s.get_template()
 
-        pt = next((p for p in tmpl.phases if p.id == phase_id), None)
+        pt = tmpl.phases_by_id.get(phase_id)
         if not pt:
             raise PhaseNotFoundError(
                 phase_id,
@@ -78,13 +110,32 @@ class ExtractionService:
                 file_path=str(file_path),
             )
 
+        if suffix in AUDIO_EXTENSIONS:
+            file_type = "audio"
+        elif suffix in PDF_EXTENSIONS:
+            file_type = "pdf"
+        else:
+            file_type = "text"
+
         ps = s.phases[phase_id]
+        had_content = ps.status != "pending"
+        resolved = _resolve_existing(had_content, append, on_existing)
+        if resolved is None:
+            return CaptureResult(
+                phase_id=phase_id,
+                phase_name=pt.name,
+                status=ps.status,
+                file_type=file_type,
+                had_content=True,
+                cancelled=True,
+            )
+
         phase_dir = s.phase_dir(phase_id)
         now = datetime.now().isoformat()
 
         if suffix in AUDIO_EXTENSIONS:
             dest = phase_dir / f"audio{suffix}"
-            shutil.copy2(file_path, dest)
+            link_or_copy(file_path, dest)
             ps.audio_file = dest.name
             ps.status = "captured"
             ps.captured_at = now
@@ -94,24 +145,27 @@ class ExtractionService:
                 phase_id=phase_id,
                 phase_name=pt.name,
                 status="captured",
-                file_type="audio",
+                file_type=file_type,
+                had_content=had_content,
             )
 
         elif suffix in TEXT_EXTENSIONS:
             dest = phase_dir / "transcript.txt"
-            new_text = file_path.read_text()
-            appended = append and dest.exists() and dest.read_text().strip()
+            new_text = file_path.read_text(encoding="utf-8")
+            existing = dest.read_text(encoding="utf-8") if resolved and dest.exists() else ""
+            appended = bool(existing.strip())
             if appended:
-                existing = dest.read_text()
-                dest.write_text(existing + "\n\n---\n\n" + new_text)
+                content = existing + "\n\n---\n\n" + new_text
+                dest.write_bytes(content.encode("utf-8"))
             else:
-                shutil.copy2(file_path, dest)
+                content = new_text
+                fastcopy(file_path, dest)
             ps.transcript_file = dest.name
             ps.status = "transcribed"
             ps.captured_at = ps.captured_at or now
             ps.transcribed_at = now
             s.save()
-            char_count = len(dest.read_text())
+            char_count = len(content)
             logger.info(
                 "Text captured for %s: %d chars (appended=%s)", phase_id, char_count, appended
             )
@@ -119,24 +173,31 @@ class ExtractionService:
                 phase_id=phase_id,
                 phase_name=pt.name,
                 status="transcribed",
-                file_type="text",
+                file_type=file_type,
                 char_count=char_count,
-                appended=bool(appended),
+                appended=appended,
+                had_content=had_content,
             )
 
         elif suffix in PDF_EXTENSIONS:
-            return self._capture_pdf(s, pt, ps, phase_dir, file_path, now, append=append)
+            return self._capture_pdf(
+                s, pt, ps, phase_dir, file_path, now, append=resolved, had_content=had_content
+            )
 
         else:
-            supported = AUDIO_EXTENSIONS | TEXT_EXTENSIONS | PDF_EXTENSIONS
             raise CaptureError(
-                f"Unsupported file type: {suffix}. Supported: {', '.join(sorted(supported))}",
+                f"Unsupported file type: {suffix}. Supported: {_SUPPORTED_LIST}",
                 phase_id=phase_id,
                 file_path=str(file_path),
             )
 
     def capture_text(
-        self, session_name: str, phase_id: str, text: str, append: bool = False
+        self,
+        session_name: str,
+        phase_id: str,
+        text: str,
+        append: bool = False,
+        on_existing: Callable[[], str] | None = None,
     ) -> CaptureResult:
         """Capture text content directly for a session phase.
 
@@ -144,6 +205,7 @@ class ExtractionService:
             append: If True and a transcript already exists, append new content
                     instead of replacing it. Resets status to "transcribed" if
                     previously extracted.
+            on_existing: Same as for :meth:`capture_file`.
 
         Raises:
             SessionNotFoundError: If session not found.
@@ -154,7 +216,7 @@ class ExtractionService:
         s = Session.load(session_name)
         tmpl = s.get_template()
 
-        pt = next((p for p in tmpl.phases if p.id == phase_id), None)
+        pt = tmpl.phases_by_id.get(phase_id)
         if not pt:
             raise PhaseNotFoundError(phase_id, session_name)
 
@@ -162,17 +224,28 @@ class ExtractionService:
             raise CaptureError("No text provided", phase_id=phase_id)
 
         ps = s.phases[phase_id]
+        had_content = ps.status != "pending"
+        resolved = _resolve_existing(had_content, append, on_existing)
+        if resolved is None:
+            return CaptureResult(
+                phase_id=phase_id,
+                phase_name=pt.name,
+                status=ps.status,
+                file_type="text",
+                had_content=True,
+                cancelled=True,
+            )
+
         phase_dir = s.phase_dir(phase_id)
         now = datetime.now().isoformat()
 
         dest = phase_dir / "transcript.txt"
-        appended = append and dest.exists() and dest.read_text().strip()
-        if appended:
-            existing = dest.read_text()
-            dest.write_text(existing + "\n\n---\n\n" + text)
-        else:
-            dest.write_text(text)
-        total_chars = len(dest.read_text())
+        existing = dest.read_text(encoding="utf-8") if resolved and dest.exists() else ""
+        appended = bool(existing.strip())
+        content = existing + "\n\n---\n\n" + text if appended else text
+        # Encode once and write the bytes; the count comes from the string we built
+        dest.write_bytes(content.encode("utf-8"))
+        total_chars = len(content)
 
         ps.transcript_file = dest.name
         ps.status = "transcribed"
@@ -187,7 +260,8 @@ class ExtractionService:
             status="transcribed",
             file_type="text",
             char_count=total_chars,
-            appended=bool(appended),
+            appended=appended,
+            had_content=had_content,
         )
 
     def check_multi_phase(self, session_name: str, pdf_text: str) -> bool:
@@ -227,7 +301,7 @@ class ExtractionService:
         transcript = transcribe_audio(audio_path)
 
         dest = s.phase_dir(phase_id) / "transcript.txt"
-        dest.write_text(transcript)
+        dest.write_bytes(transcript.encode("utf-8"))
 
         ps.transcript_file = dest.name
         ps.status = "transcribed"
@@ -254,7 +328,7 @@ class ExtractionService:
         s = Session.load(session_name)
         tmpl = s.get_template()
 
-        pt = next((p for p in tmpl.phases if p.id == phase_id), None)
+        pt = tmpl.phases_by_id.get(phase_id)
         if not pt:
             raise PhaseNotFoundError(phase_id, session_name)
 
@@ -297,15 +371,7 @@ class ExtractionService:
         )
 
         # Save extracted data
-        dest = s.phase_dir(phase_id) / "extracted.yaml"
-        with open(dest, "w") as f:
-            yaml.dump(
-                extracted,
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
-            )
+        dest = s.write_extracted(phase_id, extracted)
 
         ps.extracted_file = dest.name
         ps.status = "extracted"
@@ -340,10 +406,23 @@ class ExtractionService:
         return remaining
 
     def _capture_pdf(
-        self, s: Session, pt, ps, phase_dir: Path, file_path: Path, now: str, append: bool = False
+        self,
+        s: Session,
+        pt,
+        ps,
+        phase_dir: Path,
+        file_path: Path,
+        now: str,
+        append: bool = False,
+        had_content: bool = False,
     ) -> CaptureResult:
         """Handle PDF capture with text extraction."""
-        from sift.pdf import PDF_AVAILABLE, extract_text_from_pdf
+        from sift.pdf import (
+            PDF_AVAILABLE,
+            extract_text_from_pdf_cached,
+            extract_text_from_pdf_to_file,
+            pdf_cache_enabled,
+        )
 
         if not PDF_AVAILABLE:
             raise CaptureError(
@@ -351,20 +430,54 @@ class ExtractionService:
                 phase_id=ps.id,
             )
 
-        pdf_text, pdf_stats = extract_text_from_pdf(file_path)
+        from sift.document_analyzer import MultiPhaseDetector
 
-        # Save original PDF
-        pdf_dest = phase_dir / "document.pdf"
-        shutil.copy2(file_path, pdf_dest)
+        tmpl = s.get_template()
+        detector = MultiPhaseDetector(tmpl.phases)
 
         # Save extracted text as transcript (append if requested)
         transcript_dest = phase_dir / "transcript.txt"
-        appended = append and transcript_dest.exists() and transcript_dest.read_text().strip()
-        if appended:
-            existing = transcript_dest.read_text()
-            transcript_dest.write_text(existing + "\n\n---\n\n" + pdf_text)
-        else:
-            transcript_dest.write_text(pdf_text)
+        existing = ""
+        if append and transcript_dest.exists():
+            existing = transcript_dest.read_text(encoding="utf-8")
+        appended = bool(existing.strip())
+        prefix = existing + "\n\n---\n\n" if appended else ""
+
+        # Pages go straight into a temp file next to the transcript while a worker
+        # thread copies the original PDF (both only read file_path). Neither the
+        # transcript nor document.pdf is replaced until both have succeeded.
+        pdf_partial = phase_dir / "document.pdf.part"
+        temp_name = None
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            copy_done = pool.submit(link_or_copy, file_path, pdf_partial)
+            try:
+                with tempfile.NamedTemporaryFile(
+                    "w", dir=phase_dir, suffix=".tmp", delete=False, encoding="utf-8"
+                ) as out:
+                    temp_name = out.name
+                    if pdf_cache_enabled():
+                        from sift.models import BASE_DIR
+
+                        pdf_text, pdf_stats = extract_text_from_pdf_cached(
+                            file_path, BASE_DIR / "cache" / "pdf"
+                        )
+                        out.write(prefix)
+                        out.write(pdf_text)
+                        detector.feed(pdf_text)
+                    else:
+                        pdf_stats = extract_text_from_pdf_to_file(
+                            file_path, out, prefix=prefix, on_page=detector.feed
+                        )
+                copy_done.result()
+            except BaseException:
+                wait([copy_done])
+                pdf_partial.unlink(missing_ok=True)
+                if temp_name and os.path.exists(temp_name):
+                    os.unlink(temp_name)
+                raise
+
+        os.replace(temp_name, transcript_dest)
+        os.replace(pdf_partial, phase_dir / "document.pdf")
 
         ps.transcript_file = transcript_dest.name
         ps.status = "transcribed"
@@ -372,13 +485,8 @@ class ExtractionService:
         ps.transcribed_at = now
         s.save()
 
-        # Check if multi-phase
-        from sift.document_analyzer import detect_multi_phase_content
-
-        tmpl = s.get_template()
-        multi = len(tmpl.phases) > 1 and detect_multi_phase_content(pdf_text, tmpl.phases)
-
-        total_chars = len(transcript_dest.read_text())
+        multi = detector.is_multi_phase()
+        total_chars = len(prefix) + pdf_stats["char_count"]
         logger.info(
             "PDF captured for %s: %d pages, %d chars (appended=%s)",
             ps.id,
@@ -395,28 +503,60 @@ class ExtractionService:
             char_count=total_chars,
             pdf_stats=pdf_stats,
             multi_phase_detected=multi,
-            appended=bool(appended),
+            appended=appended,
+            had_content=had_content,
         )
 
     def _gather_context(self, s: Session, tmpl, current_phase_id: str) -> str:
         """Gather context from previous phases for extraction."""
-        context_parts = []
+        # Headers, cached dumps and separators are joined once, so each phase's
+        # YAML is copied a single time instead of into a per-phase f-string first
+        pieces: list[str] = []
         for prev_pt in tmpl.phases:
             if prev_pt.id == current_phase_id:
                 break
-            prev_data = s.get_extracted(prev_pt.id)
-            if prev_data:
-                context_parts.append(
-                    f"Data from '{prev_pt.name}':\n{yaml.dump(prev_data, default_flow_style=False)}"
-                )
-        return "\n\n".join(context_parts) if context_parts else ""
+            prev_yaml = self._phase_context_yaml(s, prev_pt.id)
+            if prev_yaml:
+                if pieces:
+                    pieces.append("\n\n")
+                pieces.append(f"Data from '{prev_pt.name}':\n")
+                pieces.append(prev_yaml)
+        return "".join(pieces)
+
+    def _phase_context_yaml(self, s: Session, phase_id: str) -> str | None:
+        """Dump a phase's extracted data for use as context, reusing earlier dumps.
+
+        Extracting phases in order would otherwise re-parse and re-dump every
+        earlier phase each time. Entries are keyed on the file's mtime, size and
+        inode; Session.write_extracted replaces the file, so re-extracting or
+        refining a phase invalidates its entry even within one mtime tick.
+        """
+        ps = s.phases.get(phase_id)
+        if not ps or not ps.extracted_file:
+            return None
+        path = s.phase_dir(phase_id) / ps.extracted_file
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._context_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        with open(path) as f:
+            data = yaml.load(f, Loader=SafeLoader)
+        dumped = yaml.dump(data, Dumper=SafeDumper, default_flow_style=False) if data else None
+        self._context_cache[path] = (key, dumped)
+        return dumped
 
     def _load_analysis_context(self, session: Session) -> dict | None:
         """Load stored project analysis context from the session directory."""
         analysis_path = session.dir / "analysis.yaml"
         if analysis_path.exists():
             with open(analysis_path) as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=SafeLoader)
         return None
 
     def _inject_analysis_context(self, existing_context: str, analysis: dict) -> str:
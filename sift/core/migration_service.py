@@ -20,7 +20,7 @@ logger = logging.getLogger("sift.core.migration")
 MigrationFn = Callable[[dict], dict]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MigrationResult:
     """Result of a single migration operation."""
 
@@ -31,8 +31,13 @@ class MigrationResult:
     dry_run: bool = False
     changes: list[str] = field(default_factory=list)
 
+    @property
+    def changes_joined(self) -> str:
+        """Change descriptions as a single "; "-separated line for table display."""
+        return "; ".join(self.changes)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MigrationSummary:
     """Summary of a batch migration run."""
 
@@ -291,10 +296,10 @@ class MigrationService:
 
     def migrate_all(self, dry_run: bool = False) -> MigrationSummary:
         """Migrate all sessions and templates."""
-        summary = MigrationSummary()
-        summary.sessions = self.migrate_all_sessions(dry_run=dry_run)
-        summary.templates = self.migrate_all_templates(dry_run=dry_run)
-        return summary
+        return MigrationSummary(
+            sessions=self.migrate_all_sessions(dry_run=dry_run),
+            templates=self.migrate_all_templates(dry_run=dry_run),
+        )
 
 
 # ── Module-level registry singleton ──
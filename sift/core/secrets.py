@@ -21,6 +21,9 @@ PROVIDER_KEY_ENV = {
     "ollama": None,  # No API key needed
 }
 
+# list_stored_providers() statuses meaning the provider is usable
+KEY_READY_STATUSES = frozenset({"env", "keyring", "file", "no key needed"})
+
 
 def _credentials_path() -> Path:
     """Return path to the credentials file."""
@@ -61,6 +64,13 @@ def _write_credentials(creds: dict[str, str]) -> None:
         logger.warning("Could not set permissions on %s", path)
 
 
+def _invalidate_config() -> None:
+    """Drop cached key lookups held by sift.config after a key change."""
+    from sift.config import Config
+
+    Config.invalidate()
+
+
 def store_key(provider: str, api_key: str) -> None:
     """Store an API key for a provider.
 
@@ -75,13 +85,14 @@ def store_key(provider: str, api_key: str) -> None:
     # Try keyring first if available
     if _store_keyring(provider, api_key):
         logger.info("Stored %s key in system keyring", provider)
-        return
+    else:
+        # Fall back to credentials file
+        creds = _read_credentials()
+        creds[env_var] = api_key
+        _write_credentials(creds)
+        logger.info("Stored %s key in credentials file", provider)
 
-    # Fall back to credentials file
-    creds = _read_credentials()
-    creds[env_var] = api_key
-    _write_credentials(creds)
-    logger.info("Stored %s key in credentials file", provider)
+    _invalidate_config()
 
 
 def get_key(provider: str) -> str | None:
@@ -139,6 +150,8 @@ def remove_key(provider: str) -> bool:
         _write_credentials(creds)
         removed = True
 
+    if removed:
+        _invalidate_config()
     return removed
 
 
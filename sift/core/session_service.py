@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -16,6 +17,7 @@ from sift.core import (
 )
 from sift.core.template_service import TemplateService
 from sift.errors import SiftError
+from sift.io_utils import SafeDumper
 from sift.models import (
     SESSIONS_DIR,
     Session,
@@ -53,16 +55,9 @@ class SessionService:
 
         template_specs = self._parse_template_arg(template_arg)
 
-        if len(template_specs) == 1:
-            _stem, path = template_specs[0]
-            tmpl = SessionTemplate.from_file(path)
-        else:
-            templates = []
-            stems = []
-            for stem, path in template_specs:
-                templates.append(SessionTemplate.from_file(path))
-                stems.append(stem)
-            tmpl = merge_templates(templates, stems)
+        # merge_templates returns a lone template as-is
+        stems = [stem for stem, _ in template_specs]
+        tmpl = merge_templates([SessionTemplate.from_file(p) for _, p in template_specs], stems)
 
         if not name:
             date_str = datetime.now().strftime("%Y-%m-%d")
@@ -85,37 +80,35 @@ class SessionService:
         """List all sessions sorted by most recently updated."""
         ensure_dirs()
 
-        session_dirs = (
-            [d for d in SESSIONS_DIR.iterdir() if d.is_dir() and (d / "session.yaml").exists()]
-            if SESSIONS_DIR.exists()
-            else []
-        )
+        # One scandir pass: directory type and mtime come from the same entry
+        entries: list[tuple[float, str]] = []
+        if SESSIONS_DIR.exists():
+            with os.scandir(SESSIONS_DIR) as it:
+                for entry in it:
+                    if entry.is_dir() and os.path.exists(os.path.join(entry.path, "session.yaml")):
+                        entries.append((entry.stat().st_mtime, entry.name))
+        entries.sort(key=lambda e: e[0], reverse=True)
 
         results = []
-        for sd in sorted(session_dirs, key=lambda d: d.stat().st_mtime, reverse=True):
+        for _, name in entries:
             try:
-                s = Session.load(sd.name)
-                total = len(s.phases)
-                done = sum(1 for p in s.phases.values() if p.status in ("extracted", "complete"))
-                in_prog = sum(
-                    1 for p in s.phases.values() if p.status in ("captured", "transcribed")
-                )
+                summary = Session.load_summary(name)
                 results.append(
                     SessionInfo(
-                        name=s.name,
-                        template_name=s.template_name,
-                        status=s.status,
-                        total_phases=total,
-                        done_phases=done,
-                        in_progress_phases=in_prog,
-                        updated_at=s.updated_at,
+                        name=summary.name,
+                        template_name=summary.template_name,
+                        status=summary.status,
+                        total_phases=summary.total_phases,
+                        done_phases=summary.done_phases,
+                        in_progress_phases=summary.in_progress_phases,
+                        updated_at=summary.updated_at,
                     )
                 )
             except (SiftError, yaml.YAMLError) as e:
-                logger.warning("Failed to load session %s: %s", sd.name, e)
+                logger.warning("Failed to load session %s: %s", name, e)
                 results.append(
                     SessionInfo(
-                        name=sd.name,
+                        name=name,
                         template_name="?",
                         status="error",
                         total_phases=0,
@@ -174,10 +167,13 @@ class SessionService:
         out_path = None
         if output_dir:
             out_path = output_dir / f"{session_name}-export.yaml"
-            with open(out_path, "w") as f:
+            # The emitter writes ~16 KB chunks as it goes; a large buffer batches
+            # them so transcript-heavy exports don't cost a syscall per chunk
+            with open(out_path, "w", buffering=1 << 20) as f:
                 yaml.dump(
                     export,
                     f,
+                    Dumper=SafeDumper,
                     default_flow_style=False,
                     sort_keys=False,
                     allow_unicode=True,
@@ -219,8 +215,20 @@ class SessionService:
     def _build_session_detail(self, s: Session, tmpl: SessionTemplate) -> SessionDetail:
         """Build a SessionDetail from a Session and its template."""
         phases = []
+        # First phase in template order waiting on each step, found in the same pass
+        first_transcribed = first_captured = first_pending = None
         for pt in tmpl.phases:
             ps = s.phases.get(pt.id)
+            if ps:
+                status = ps.status
+                if status == "transcribed":
+                    if first_transcribed is None:
+                        first_transcribed = pt.id
+                elif status == "captured":
+                    if first_captured is None:
+                        first_captured = pt.id
+                elif status == "pending" and first_pending is None:
+                    first_pending = pt.id
             phases.append(
                 PhaseDetail(
                     id=pt.id,
@@ -238,30 +246,16 @@ class SessionService:
         total = len(s.phases)
         done = sum(1 for p in s.phases.values() if p.status in ("extracted", "complete"))
 
-        # Determine next action
+        # Determine next action: extract beats transcribe beats capture
         next_action = None
         next_action_phase = None
-        for pt in tmpl.phases:
-            ps = s.phases.get(pt.id)
-            if ps and ps.status == "transcribed":
-                next_action = "extract"
-                next_action_phase = pt.id
-                break
-        if not next_action:
-            for pt in tmpl.phases:
-                ps = s.phases.get(pt.id)
-                if ps and ps.status == "captured":
-                    next_action = "transcribe"
-                    next_action_phase = pt.id
-                    break
-        if not next_action:
-            for pt in tmpl.phases:
-                ps = s.phases.get(pt.id)
-                if ps and ps.status == "pending":
-                    next_action = "capture"
-                    next_action_phase = pt.id
-                    break
-        if not next_action and done == total:
+        if first_transcribed is not None:
+            next_action, next_action_phase = "extract", first_transcribed
+        elif first_captured is not None:
+            next_action, next_action_phase = "transcribe", first_captured
+        elif first_pending is not None:
+            next_action, next_action_phase = "capture", first_pending
+        elif done == total:
             next_action = "build"
 
         return SessionDetail(
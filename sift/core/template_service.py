@@ -3,17 +3,29 @@
 from __future__ import annotations
 
 import logging
-import shutil
+import os
 from pathlib import Path
 
 import yaml
 
 from sift.core import TemplateDetail, TemplateInfo, TemplatePhaseDetail
 from sift.errors import SiftError
-from sift.models import TEMPLATES_DIR, SessionTemplate, ensure_dirs
+from sift.io_utils import SafeDumper, fastcopy
+from sift.models import TEMPLATES_DIR, SessionTemplate, ensure_dirs, remember_template
 
 logger = logging.getLogger("sift.core.template")
 
+# Template paths resolved by name, keyed by (templates dir, name) with the dir's mtime_ns
+_path_cache: dict[tuple[Path, str], tuple[int, Path]] = {}
+
+
+def _template_files() -> list[Path]:
+    """Template YAML files in TEMPLATES_DIR, sorted, from a single directory scan."""
+    with os.scandir(TEMPLATES_DIR) as it:
+        return sorted(
+            Path(e.path) for e in it if e.name.endswith((".yaml", ".yml")) and e.is_file()
+        )
+
 
 class TemplateService:
     """Manages session template operations."""
@@ -21,7 +33,7 @@ class TemplateService:
     def list_templates(self) -> list[TemplateInfo]:
         """List all available templates."""
         ensure_dirs()
-        paths = sorted(list(TEMPLATES_DIR.glob("*.yaml")) + list(TEMPLATES_DIR.glob("*.yml")))
+        paths = _template_files()
 
         results = []
         for tp in paths:
@@ -95,7 +107,7 @@ class TemplateService:
         slug = name.lower().replace(" ", "-").replace("_", "-")
         path = TEMPLATES_DIR / f"{slug}.yaml"
         with open(path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
         logger.info("Template saved to %s", path)
         return path
@@ -125,7 +137,9 @@ class TemplateService:
             raise SiftError(f"Could not read template file: {e}") from e
 
         dest = TEMPLATES_DIR / path.name
-        shutil.copy2(path, dest)
+        fastcopy(path, dest)
+        # The validation parse above doubles as the parse of the installed copy
+        remember_template(dest, t)
         logger.info("Imported template '%s' to %s", t.name, dest)
 
         return TemplateInfo(
@@ -139,8 +153,7 @@ class TemplateService:
     def get_template_names(self) -> list[str]:
         """Get all template stem names (for shell completion)."""
         ensure_dirs()
-        paths = list(TEMPLATES_DIR.glob("*.yaml")) + list(TEMPLATES_DIR.glob("*.yml"))
-        return sorted(p.stem for p in paths)
+        return sorted(p.stem for p in _template_files())
 
     def find_template(self, name: str) -> Path:
         """Find a template by name. Public wrapper for _find_template_path.
@@ -193,8 +206,9 @@ class TemplateService:
 
         slug = t.name.lower().replace(" ", "-").replace("_", "-")
         dest = TEMPLATES_DIR / f"{slug}.yaml"
-        shutil.copy2(tmp_path, dest)
+        fastcopy(tmp_path, dest)
         tmp_path.unlink(missing_ok=True)
+        remember_template(dest, t)
 
         logger.info("Installed template '%s' from %s to %s", t.name, url, dest)
 
@@ -237,9 +251,21 @@ class TemplateService:
         """Find a template file by name."""
         from sift.errors import TemplateNotFoundError
 
+        # Adding or removing a template bumps the directory mtime, invalidating the cache
+        try:
+            dir_mtime = os.stat(TEMPLATES_DIR).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        key = (TEMPLATES_DIR, name)
+        cached = _path_cache.get(key)
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+
         for ext in (".yaml", ".yml"):
             path = TEMPLATES_DIR / f"{name}{ext}"
             if path.exists():
+                if dir_mtime is not None:
+                    _path_cache[key] = (dir_mtime, path)
                 return path
         # Try as absolute/relative path
         p = Path(name)
@@ -5,13 +5,22 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 import yaml
 
 from sift.providers import get_provider
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger("sift.document_analyzer")
 
+# Documents shorter than this are treated as single-phase without scanning
+MIN_MULTI_PHASE_CHARS = 2000
+
 
 @dataclass
 class PhaseMapping:
@@ -29,6 +38,7 @@ def analyze_document_for_phases(
     document_text: str,
     phases: list,
     template_name: str = "",
+    include_content: bool = True,
 ) -> list[PhaseMapping]:
     """Use AI to map document sections to template phases.
 
@@ -36,6 +46,9 @@ def analyze_document_for_phases(
         document_text: Full text with [Page N] markers
         phases: List of PhaseTemplate objects from the template
         template_name: Name of the template (for context)
+        include_content: Populate ``PhaseMapping.content`` with each phase's pages.
+            Pass False to get page ranges only and slice the text on demand with
+            ``extract_pages`` (avoids holding every phase's copy at once).
 
     Returns:
         List of PhaseMapping objects for phases that have matching content.
@@ -159,7 +172,7 @@ Only include phases that have actual matching content. Omit phases with no match
         confidence = entry.get("confidence", "medium")
 
         # Extract actual content for these pages
-        content = _extract_pages(document_text, pages_str)
+        content = extract_pages(document_text, pages_str) if include_content else ""
 
         mappings.append(
             PhaseMapping(
@@ -187,11 +200,11 @@ def split_document_by_pages(document_text: str, page_ranges: dict[str, str]) ->
     """
     result = {}
     for phase_id, pages_str in page_ranges.items():
-        result[phase_id] = _extract_pages(document_text, pages_str)
+        result[phase_id] = extract_pages(document_text, pages_str)
     return result
 
 
-def _extract_pages(document_text: str, pages_str: str) -> str:
+def extract_pages(document_text: str, pages_str: str) -> str:
     """Extract content for specific pages from document text with [Page N] markers."""
     if not pages_str or pages_str.lower() == "all":
         return document_text
@@ -237,6 +250,83 @@ def _extract_pages(document_text: str, pages_str: str) -> str:
     return "\n\n".join(collected) if collected else ""
 
 
+def _phase_keywords(phase) -> set[str]:
+    """Build the keyword set for a phase from its name, field IDs, and field prompts."""
+    keywords = set()
+
+    # Phase name words (split on spaces, skip short words)
+    for word in phase.name.lower().split():
+        if len(word) > 3:
+            keywords.add(word)
+
+    # Extraction field IDs and key words from prompts
+    if phase.extract:
+        for field in phase.extract:
+            # Field ID (replace underscores with spaces)
+            for word in field.id.replace("_", " ").lower().split():
+                if len(word) > 3:
+                    keywords.add(word)
+            # Key words from field prompt
+            for word in field.prompt.lower().split():
+                if len(word) > 4:
+                    keywords.add(word)
+
+    return keywords
+
+
+@lru_cache(maxsize=8)
+def _keyword_automaton(keywords: frozenset[str]):
+    """Aho-Corasick automaton over all keywords, so one pass finds every hit."""
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+class MultiPhaseDetector:
+    """Incremental form of detect_multi_phase_content.
+
+    Feed it the document a chunk at a time (e.g. one PDF page) so callers that
+    stream text never need the whole document in memory. Chunks must break on
+    whitespace, which page boundaries always do, since keywords never contain any.
+    """
+
+    def __init__(self, phases: list):
+        self._phases = [kw for kw in map(_phase_keywords, phases) if kw]
+        self._enabled = len(phases) >= 2
+        self._length = 0
+        self._found: set[str] = set()
+
+        keywords = frozenset().union(*self._phases)
+        self._missing = set(keywords)
+        self._automaton = None
+        if ahocorasick is not None and self._enabled and keywords:
+            self._automaton = _keyword_automaton(keywords)
+
+    def feed(self, text: str) -> None:
+        if not self._enabled:
+            return
+        self._length += len(text)
+        chunk = text.lower()
+        if self._automaton is not None:
+            self._found.update(kw for _, kw in self._automaton.iter(chunk))
+        elif self._missing:
+            hits = [kw for kw in self._missing if kw in chunk]
+            self._missing.difference_update(hits)
+            self._found.update(hits)
+
+    def is_multi_phase(self) -> bool:
+        if not self._enabled or self._length < MIN_MULTI_PHASE_CHARS:
+            return False
+        # A phase is "covered" if >30% of its keywords appear
+        found = self._found
+        phases_matched = sum(
+            1 for keywords in self._phases if len(keywords & found) / len(keywords) > 0.3
+        )
+        return phases_matched >= 2
+
+
 def detect_multi_phase_content(document_text: str, phases: list) -> bool:
     """Quick heuristic check: does this document likely cover multiple phases?
 
@@ -250,42 +340,9 @@ def detect_multi_phase_content(document_text: str, phases: list) -> bool:
     Returns:
         True if the document likely covers 2+ phases
     """
-    if len(phases) < 2:
+    if len(phases) < 2 or len(document_text) < MIN_MULTI_PHASE_CHARS:
         return False
 
-    doc_lower = document_text.lower()
-    phases_matched = 0
-
-    for phase in phases:
-        # Build keyword set from phase name, prompt, and extraction fields
-        keywords = set()
-
-        # Phase name words (split on spaces, skip short words)
-        for word in phase.name.lower().split():
-            if len(word) > 3:
-                keywords.add(word)
-
-        # Extraction field IDs and key words from prompts
-        if phase.extract:
-            for field in phase.extract:
-                # Field ID (replace underscores with spaces)
-                for word in field.id.replace("_", " ").lower().split():
-                    if len(word) > 3:
-                        keywords.add(word)
-                # Key words from field prompt
-                for word in field.prompt.lower().split():
-                    if len(word) > 4:
-                        keywords.add(word)
-
-        if not keywords:
-            continue
-
-        # Count how many keywords match
-        matches = sum(1 for kw in keywords if kw in doc_lower)
-        match_ratio = matches / len(keywords) if keywords else 0
-
-        # A phase is "covered" if >30% of its keywords appear
-        if match_ratio > 0.3:
-            phases_matched += 1
-
-    return phases_matched >= 2
+    detector = MultiPhaseDetector(phases)
+    detector.feed(document_text)
+    return detector.is_multi_phase()
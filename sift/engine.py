@@ -35,6 +35,9 @@ def transcribe_audio(audio_path: Path) -> str:
     mp3_path = audio_path.with_suffix(".mp3")
     if audio_path.suffix != ".mp3":
         logger.info("Converting %s to mp3...", audio_path.suffix)
+        # An earlier mp3 upload may be hard-linked to the user's file; don't let
+        # ffmpeg -y overwrite it in place.
+        mp3_path.unlink(missing_ok=True)
         result = subprocess.run(
             ["ffmpeg", "-i", str(audio_path), "-q:a", "2", str(mp3_path), "-y"],
             capture_output=True,
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from itertools import islice
+
 import typer
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
@@ -11,7 +13,15 @@ from rich.text import Text
 from sift.core.build_service import BuildService
 from sift.core.extraction_service import ExtractionService
 from sift.models import Session, ensure_dirs
-from sift.ui import ICONS, console, format_next_step, pipeline_view, section_divider, step_header
+from sift.ui import (
+    ICONS,
+    console,
+    format_next_step,
+    pipeline_view,
+    read_until_end,
+    section_divider,
+    step_header,
+)
 
 _extraction_svc = ExtractionService()
 _build_svc = BuildService()
@@ -67,7 +77,7 @@ def _show_extraction_summary(session: Session, phase_id: str, template):
     if not extracted:
         return
 
-    pt = next((p for p in template.phases if p.id == phase_id), None)
+    pt = template.phases_by_id.get(phase_id)
     phase_name = pt.name if pt else phase_id
 
     table = Table(
@@ -97,13 +107,12 @@ def _show_extraction_summary(session: Session, phase_id: str, template):
             else:
                 display = "[dim](none)[/dim]"
         elif isinstance(value, dict):
-            display = "\n".join(f"{k}: {v}" for k, v in list(value.items())[:5])
+            display = "\n".join(f"{k}: {v}" for k, v in islice(value.items(), 5))
             if len(value) > 5:
                 display += f"\n[dim]... and {len(value) - 5} more[/dim]"
         else:
-            display = str(value)[:200]
-            if len(str(value)) > 200:
-                display += "..."
+            text = str(value)
+            display = text[:200] + "..." if len(text) > 200 else text
 
         table.add_row(field_id.replace("_", " ").title(), display)
 
@@ -236,17 +245,7 @@ def run_interactive(session_name: str, start_phase: str = None):
                 console.print(
                     "\n  [bold]Enter text.[/bold] [dim]Empty line + 'END' to finish.[/dim]\n"
                 )
-                lines = []
-                while True:
-                    try:
-                        line = input()
-                        if line.strip() == "END":
-                            break
-                        lines.append(line)
-                    except (EOFError, KeyboardInterrupt):
-                        console.print()
-                        break
-                text = "\n".join(lines)
+                text = read_until_end()
                 if text.strip():
                     try:
                         _extraction_svc.capture_text(session_name, pt.id, text, append=append)
@@ -0,0 +1,43 @@
+"""File and YAML I/O helpers shared across sift."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+# LibYAML-backed loader/dumper when PyYAML was built with it, else the pure-Python ones
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper, SafeLoader  # noqa: F401
+
+
+def fastcopy(src: Path | str, dst: Path | str) -> None:
+    """Copy file contents from src to dst without copying metadata.
+
+    shutil.copyfile already uses the kernel fast paths (sendfile on Linux,
+    fcopyfile on macOS, CopyFileW on Windows). Uploaded files land in a fresh
+    session directory, so the extra copystat() done by shutil.copy2 is skipped.
+    """
+    shutil.copyfile(src, dst)
+
+
+def link_or_copy(src: Path | str, dst: Path | str) -> None:
+    """Hard-link src at dst, falling back to fastcopy when linking isn't possible.
+
+    A link is O(1) whatever the file size, but it shares the inode with the
+    user's original, so only use this for files sift never writes into in place
+    (uploaded audio and PDFs, not transcripts). Any existing dst is unlinked
+    first, so replacing it never writes through to a previously linked source.
+    """
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device (EXDEV), no link support, or not permitted: copy instead
+        fastcopy(src, dst)
@@ -370,11 +370,11 @@ async def sift_doctor() -> dict:
     )
 
     # Provider keys
-    from sift.core.secrets import list_stored_providers
+    from sift.core.secrets import KEY_READY_STATUSES, list_stored_providers
 
     key_status = list_stored_providers()
     for provider, status in key_status.items():
-        has_key = status in ("env", "keyring", "file", "no key needed")
+        has_key = status in KEY_READY_STATUSES
         checks.append({"check": f"provider_{provider}", "ok": has_key, "detail": status})
 
     all_ok = all(c["ok"] for c in checks if not str(c["check"]).startswith("provider_"))
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 import os
 import tempfile
@@ -12,6 +15,7 @@ import tempfile
 import yaml
 
 from .config import get_sift_home
+from .io_utils import SafeDumper, SafeLoader
 
 # ── Schema Versions ──
 SCHEMA_VERSION_SESSION = 1
@@ -23,10 +27,22 @@ TEMPLATES_DIR = BASE_DIR / "templates"
 SESSIONS_DIR = BASE_DIR / "sessions"
 
 
+# The (templates, sessions) pair ensure_dirs() last created, so repeat calls skip the mkdirs
+_dirs_ensured: tuple[Path, Path] | None = None
+
+
 def ensure_dirs():
-    """Create base directories if they don't exist."""
+    """Create base directories if they don't exist.
+
+    Only the first call per process (per data directory) touches the disk.
+    """
+    global _dirs_ensured
+    dirs = (TEMPLATES_DIR, SESSIONS_DIR)
+    if _dirs_ensured == dirs:
+        return
     TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
     SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+    _dirs_ensured = dirs
 
 
 # ── Template Models ──
@@ -123,6 +139,11 @@ class SessionTemplate:
         """Template repository URL from metadata."""
         return str(self.metadata.get("repository", ""))
 
+    @cached_property
+    def phases_by_id(self) -> dict[str, PhaseTemplate]:
+        """Phases keyed by ID, built on first use."""
+        return {p.id: p for p in self.phases}
+
     def validate(self):
         """Validate template for logical consistency.
 
@@ -163,10 +184,29 @@ class SessionTemplate:
 
     @classmethod
     def from_file(cls, path: Path) -> SessionTemplate:
+        """Load a template, reusing the parsed result while the file is unchanged.
+
+        Cached templates are shared between callers, so treat the returned
+        object as read-only (merge_templates builds new phases rather than
+        editing its inputs).
+        """
+        st = os.stat(path)
+        key = str(path)
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = _template_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        tmpl = cls._parse_file(path)
+        _cache_template(key, signature, tmpl)
+        return tmpl
+
+    @classmethod
+    def _parse_file(cls, path: Path) -> SessionTemplate:
         from sift.errors import SchemaVersionError
 
         with open(path) as f:
-            d = yaml.safe_load(f)
+            d = yaml.load(f, Loader=SafeLoader)
 
         file_version = d.get("schema_version", 0)
         if file_version > SCHEMA_VERSION_TEMPLATE:
@@ -209,6 +249,27 @@ class SessionTemplate:
         }
 
 
+# Parsed templates keyed by path, with the (mtime_ns, size, inode) they were read at.
+_TEMPLATE_CACHE_SIZE = 256
+_template_cache: dict[str, tuple[tuple[int, int, int], SessionTemplate]] = {}
+
+
+def _cache_template(key: str, signature: tuple, tmpl: SessionTemplate) -> None:
+    if key not in _template_cache and len(_template_cache) >= _TEMPLATE_CACHE_SIZE:
+        del _template_cache[next(iter(_template_cache))]
+    _template_cache[key] = (signature, tmpl)
+
+
+def remember_template(path: Path, tmpl: SessionTemplate) -> None:
+    """Seed the template cache for a file that is a byte-for-byte copy of tmpl's source.
+
+    Lets an install step that already parsed (and validated) the source hand
+    the result to the next from_file() on the copy instead of parsing it again.
+    """
+    st = os.stat(path)
+    _cache_template(str(path), (st.st_mtime_ns, st.st_size, st.st_ino), tmpl)
+
+
 def merge_templates(templates: list[SessionTemplate], stems: list[str]) -> SessionTemplate:
     """Merge multiple templates into one, namespacing phase IDs to avoid conflicts.
 
@@ -266,6 +327,23 @@ class PhaseState:
     source_pages: str | None = None  # e.g., "1-3" or "all"
 
 
+@dataclass(frozen=True)
+class SessionSummary:
+    """The few session.yaml fields a session listing row needs."""
+
+    name: str
+    template_name: str
+    status: str
+    total_phases: int
+    done_phases: int
+    in_progress_phases: int
+    updated_at: str
+
+
+# Listing summaries keyed by session.yaml path, with the session.yaml signature they were read at.
+_summary_cache: dict[str, tuple[tuple[int, int, int], SessionSummary]] = {}
+
+
 @dataclass
 class Session:
     name: str
@@ -276,6 +354,8 @@ class Session:
     status: str = "active"  # active, complete, archived
     documents: list[dict] = field(default_factory=list)
     source_templates: list[str] = field(default_factory=list)
+    _txn_depth: int = field(default=0, init=False, repr=False, compare=False)
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
 
     @property
     def dir(self) -> Path:
@@ -312,7 +392,26 @@ class Session:
         session.save()
         return session
 
+    @contextmanager
+    def transaction(self) -> Iterator[Session]:
+        """Coalesce save() calls made inside the block into one write on exit.
+
+        Blocks nest; only the outermost one writes. Pending changes are still
+        written if the block raises, just as the individual saves would have been.
+        """
+        self._txn_depth += 1
+        try:
+            yield self
+        finally:
+            self._txn_depth -= 1
+            if not self._txn_depth and self._dirty:
+                self._dirty = False
+                self.save()
+
     def save(self):
+        if self._txn_depth:
+            self._dirty = True
+            return
         self.updated_at = datetime.now().isoformat()
         state = {
             "schema_version": SCHEMA_VERSION_SESSION,
@@ -340,8 +439,9 @@ class Session:
             },
         }
         dest = self.dir / "session.yaml"
+        payload = yaml.dump(state, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
         with tempfile.NamedTemporaryFile("w", dir=self.dir, delete=False) as tf:
-            yaml.dump(state, tf, default_flow_style=False, sort_keys=False)
+            tf.write(payload)
             temp_name = tf.name
 
         try:
@@ -360,7 +460,7 @@ class Session:
             raise SessionNotFoundError(name)
 
         with open(session_dir / "session.yaml") as f:
-            d = yaml.safe_load(f)
+            d = yaml.load(f, Loader=SafeLoader)
 
         file_version = d.get("schema_version", 0)
         if file_version > SCHEMA_VERSION_SESSION:
@@ -396,18 +496,79 @@ class Session:
             source_templates=d.get("source_templates", []),
         )
 
+    @classmethod
+    def load_summary(cls, name: str) -> SessionSummary:
+        """Read a session's listing fields without building its PhaseStates.
+
+        The result is cached per process until session.yaml changes, which
+        every save() does via an atomic replace.
+        """
+        from sift.errors import SchemaVersionError, SessionNotFoundError
+
+        path = SESSIONS_DIR / name / "session.yaml"
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            raise SessionNotFoundError(name) from None
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        key = str(path)
+        cached = _summary_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with open(path) as f:
+            d = yaml.load(f, Loader=SafeLoader)
+
+        file_version = d.get("schema_version", 0)
+        if file_version > SCHEMA_VERSION_SESSION:
+            raise SchemaVersionError(
+                str(path),
+                found_version=file_version,
+                expected_version=SCHEMA_VERSION_SESSION,
+            )
+
+        phases = d.get("phases", {})
+        done = in_progress = 0
+        for ps in phases.values():
+            status = ps.get("status", "pending")
+            if status == "extracted" or status == "complete":
+                done += 1
+            elif status == "captured" or status == "transcribed":
+                in_progress += 1
+
+        summary = SessionSummary(
+            name=d["name"],
+            template_name=d["template_name"],
+            status=d.get("status", "active"),
+            total_phases=len(phases),
+            done_phases=done,
+            in_progress_phases=in_progress,
+            updated_at=d["updated_at"],
+        )
+        _summary_cache[key] = (signature, summary)
+        return summary
+
     def get_template(self) -> SessionTemplate:
         return SessionTemplate.from_file(self.dir / "template.yaml")
 
     def phase_dir(self, phase_id: str) -> Path:
         return self.dir / "phases" / phase_id
 
-    def get_transcript(self, phase_id: str) -> str | None:
+    def get_transcript(self, phase_id: str, max_chars: int | None = None) -> str | None:
+        """Read a phase transcript.
+
+        With max_chars, at most max_chars + 1 characters are read from disk, so
+        a preview can be taken (and truncation detected) without loading the
+        whole file.
+        """
         ps = self.phases.get(phase_id)
         if ps and ps.transcript_file:
             path = self.phase_dir(phase_id) / ps.transcript_file
             if path.exists():
-                return path.read_text()
+                if max_chars is None:
+                    return path.read_text(encoding="utf-8")
+                with open(path, encoding="utf-8") as f:
+                    return f.read(max_chars + 1)
         return None
 
     def get_extracted(self, phase_id: str) -> dict | None:
@@ -416,5 +577,67 @@ class Session:
             path = self.phase_dir(phase_id) / ps.extracted_file
             if path.exists():
                 with open(path) as f:
-                    return yaml.safe_load(f)
+                    return yaml.load(f, Loader=SafeLoader)
         return None
+
+    def load_all_artifacts(self, phase_ids: Iterable[str]) -> tuple[dict, dict]:
+        """Load extracted data and transcripts for phase_ids in one pass.
+
+        Returns (extracted, transcripts) dicts keyed by phase ID in the given
+        order, holding only non-empty entries. Phases with no recorded file are
+        skipped without touching the disk, and recorded files are opened
+        directly rather than stat'ed first.
+        """
+        extracted: dict[str, dict] = {}
+        transcripts: dict[str, str] = {}
+        for phase_id in phase_ids:
+            ps = self.phases.get(phase_id)
+            if not ps:
+                continue
+            phase_dir = self.phase_dir(phase_id)
+            if ps.extracted_file:
+                try:
+                    with open(phase_dir / ps.extracted_file) as f:
+                        data = yaml.load(f, Loader=SafeLoader)
+                except FileNotFoundError:
+                    data = None
+                if data:
+                    extracted[phase_id] = data
+            if ps.transcript_file:
+                try:
+                    with open(phase_dir / ps.transcript_file, encoding="utf-8") as f:
+                        text = f.read()
+                except FileNotFoundError:
+                    text = None
+                if text:
+                    transcripts[phase_id] = text
+        return extracted, transcripts
+
+    def write_extracted(self, phase_id: str, data: dict) -> Path:
+        """Atomically write a phase's extracted.yaml and return its path.
+
+        The YAML is dumped to a string, written to a temp file in the phase
+        directory in one call and moved into place with os.replace, so readers
+        never see a half-written file.
+        Phase state is not touched; callers update it and save() as needed.
+        """
+        phase_dir = self.phase_dir(phase_id)
+        dest = phase_dir / "extracted.yaml"
+        payload = yaml.dump(
+            data,
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
+        with tempfile.NamedTemporaryFile("w", dir=phase_dir, suffix=".tmp", delete=False) as tf:
+            tf.write(payload)
+            temp_name = tf.name
+
+        try:
+            os.replace(temp_name, dest)
+        except Exception:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+            raise
+        return dest
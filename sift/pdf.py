@@ -1,7 +1,14 @@
 """PDF extraction utilities for sift."""
 
+import hashlib
+import json
+import mmap
+import os
 import re
+import tempfile
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import IO
 
 try:
     import pdfplumber
@@ -53,26 +60,33 @@ def _table_to_markdown(table: list[list]) -> str:
     return "\n".join(lines)
 
 
+def _page_edge_lines(page) -> tuple[str | None, str | None]:
+    """Return the first and last non-blank lines of a page, for header/footer detection."""
+    text = page.extract_text()
+    page.flush_cache()
+    if not text:
+        return None, None
+    lines = [line.strip() for line in text.split("\n") if line.strip()]
+    if not lines:
+        return None, None
+    return lines[0], lines[-1]
+
+
 def _detect_headers_footers(pages) -> tuple[set[str], set[str]]:
     """Detect repeating headers and footers across pages."""
     if len(pages) < 3:
         return set(), set()
+    return _headers_footers_from_edges([_page_edge_lines(page) for page in pages])
 
-    first_lines = []
-    last_lines = []
 
-    for page in pages:
-        text = page.extract_text()
-        if not text:
-            continue
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
-        if lines:
-            first_lines.append(lines[0])
-        if lines:
-            last_lines.append(lines[-1])
+def _headers_footers_from_edges(
+    edges: list[tuple[str | None, str | None]],
+) -> tuple[set[str], set[str]]:
+    first_lines = [first for first, _ in edges if first is not None]
+    last_lines = [last for _, last in edges if last is not None]
 
     # A header/footer repeats on most pages (>60%)
-    threshold = len(pages) * 0.6
+    threshold = len(edges) * 0.6
     headers = set()
     footers = set()
 
@@ -159,13 +173,7 @@ def _extract_page_content(page, headers: set[str], footers: set[str]) -> list[tu
     return content_blocks
 
 
-def extract_text_from_pdf(pdf_path: Path) -> tuple[str, dict]:
-    """Extract text content from a PDF file with table preservation.
-
-    Returns:
-        Tuple of (extracted_text, stats_dict) where stats contains
-        page_count, table_count, and char_count.
-    """
+def _validate_pdf(pdf_path: Path) -> None:
     if not PDF_AVAILABLE:
         raise ImportError("PDF libraries not installed. Install with: pip install pdfplumber")
 
@@ -178,77 +186,246 @@ def extract_text_from_pdf(pdf_path: Path) -> tuple[str, dict]:
     except (OSError, ValueError) as e:
         raise ValueError(f"Could not validate PDF file: {e}") from e
 
+
+def extract_text_from_pdf(pdf_path: Path) -> tuple[str, dict]:
+    """Extract text content from a PDF file with table preservation.
+
+    Returns:
+        Tuple of (extracted_text, stats_dict) where stats contains
+        page_count, table_count, and char_count.
+    """
+    _validate_pdf(pdf_path)
+
     stats = {"page_count": 0, "table_count": 0, "char_count": 0}
 
+    full_text = "\n\n".join(_iter_pages(pdf_path, stats))
+
+    if not full_text.strip():
+        raise ValueError("No text could be extracted from the PDF")
+
+    stats["char_count"] = len(full_text)
+    return full_text, stats
+
+
+def extract_text_from_pdf_to_file(
+    pdf_path: Path,
+    out: IO[str],
+    prefix: str = "",
+    on_page: Callable[[str], None] | None = None,
+) -> dict:
+    """Extract a PDF page by page, writing each page to ``out`` as it is parsed.
+
+    Produces the same text as extract_text_from_pdf without ever holding the
+    whole document in memory. ``prefix`` is written just before the first page
+    (so nothing is written for an empty PDF), and ``on_page`` sees every page
+    chunk as it goes by. The returned stats' char_count excludes the prefix.
+    """
+    _validate_pdf(pdf_path)
+
+    stats = {"page_count": 0, "table_count": 0, "char_count": 0}
+    separator = prefix
+    has_text = False
+
+    for page_text in _iter_pages(pdf_path, stats):
+        out.write(separator)
+        out.write(page_text)
+        if on_page is not None:
+            on_page(page_text)
+        if stats["char_count"]:
+            stats["char_count"] += 2
+        stats["char_count"] += len(page_text)
+        has_text = has_text or bool(page_text.strip())
+        separator = "\n\n"
+
+    if not has_text:
+        raise ValueError("No text could be extracted from the PDF")
+
+    return stats
+
+
+def _iter_pages(pdf_path: Path, stats: dict) -> Iterator[str]:
     if PDF_ENGINE == "pdfplumber":
+        if os.path.getsize(pdf_path) >= PARALLEL_MIN_BYTES:
+            return _extract_with_pdfplumber_parallel(pdf_path, stats)
         return _extract_with_pdfplumber(pdf_path, stats)
-    else:
-        return _extract_with_pypdf(pdf_path, stats)
+    return _extract_with_pypdf(pdf_path, stats)
+
+
+def _render_page(
+    page, page_num: int, headers: set[str], footers: set[str]
+) -> tuple[str | None, int]:
+    """Render one pdfplumber page as "[Page N]" text; returns (text or None, table count)."""
+    # Extract all content blocks in reading order
+    blocks = _extract_page_content(page, headers, footers)
+
+    # Drop the parsed layout objects so memory stays flat across pages
+    page.flush_cache()
+
+    if not blocks:
+        return None, 0
+
+    # Count tables on this page
+    tables = sum(1 for _, content in blocks if content.startswith("|") and " | " in content)
+    page_text = "\n\n".join(content for _, content in blocks)
+    return f"[Page {page_num}]\n{page_text}", tables
 
 
-def _extract_with_pdfplumber(pdf_path: Path, stats: dict) -> tuple[str, dict]:
+def _extract_with_pdfplumber(pdf_path: Path, stats: dict) -> Iterator[str]:
     """Extract using pdfplumber with table structure preservation."""
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            stats["page_count"] = len(pdf.pages)
+    with pdfplumber.open(pdf_path) as pdf:
+        stats["page_count"] = len(pdf.pages)
 
-            # Detect headers/footers
-            headers, footers = _detect_headers_footers(pdf.pages)
+        # Detect headers/footers
+        headers, footers = _detect_headers_footers(pdf.pages)
 
-            text_parts = []
+        for page_num, page in enumerate(pdf.pages, start=1):
+            page_text, tables = _render_page(page, page_num, headers, footers)
+            stats["table_count"] += tables
+            if page_text is not None:
+                yield page_text
 
-            for page_num, page in enumerate(pdf.pages, start=1):
-                # Extract all content blocks in reading order
-                blocks = _extract_page_content(page, headers, footers)
 
-                if blocks:
-                    # Count tables on this page
-                    for _, content in blocks:
-                        if content.startswith("|") and " | " in content:
-                            stats["table_count"] += 1
+# ── Parallel extraction ──
 
-                    page_text = "\n\n".join(content for _, content in blocks)
-                    text_parts.append(f"[Page {page_num}]\n{page_text}")
+# Below this size (or page count) the process pool costs more than it saves.
+PARALLEL_MIN_BYTES = 1024 * 1024
+PARALLEL_MIN_PAGES = 8
 
-        full_text = "\n\n".join(text_parts)
 
-        if not full_text.strip():
-            raise ValueError("No text could be extracted from the PDF")
+def _default_workers() -> int:
+    return min(os.cpu_count() or 1, 8)
 
-        stats["char_count"] = len(full_text)
-        return full_text, stats
 
-    except Exception as e:
-        if "No text could be extracted" in str(e):
-            raise
-        raise
+def _edge_lines_worker(pdf_path: Path, start: int, stop: int) -> list:
+    # pdfplumber objects don't pickle, so every worker reopens the file
+    with pdfplumber.open(pdf_path) as pdf:
+        return [_page_edge_lines(page) for page in pdf.pages[start:stop]]
+
+
+def _render_pages_worker(
+    pdf_path: Path, start: int, stop: int, headers: set[str], footers: set[str]
+) -> list[tuple[str | None, int]]:
+    with pdfplumber.open(pdf_path) as pdf:
+        return [
+            _render_page(page, page_num, headers, footers)
+            for page_num, page in enumerate(pdf.pages[start:stop], start=start + 1)
+        ]
 
 
-def _extract_with_pypdf(pdf_path: Path, stats: dict) -> tuple[str, dict]:
+def _extract_with_pdfplumber_parallel(
+    pdf_path: Path, stats: dict, workers: int | None = None
+) -> Iterator[str]:
+    """Same output as _extract_with_pdfplumber, with pages spread over a process pool.
+
+    Header/footer detection needs every page's first and last line before any
+    page can be rendered, so the pool runs two passes over the same batches.
+    Pages are still yielded in order, as soon as their batch is done.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    with pdfplumber.open(pdf_path) as pdf:
+        page_count = len(pdf.pages)
+
+    workers = workers or _default_workers()
+    if workers < 2 or page_count < PARALLEL_MIN_PAGES:
+        yield from _extract_with_pdfplumber(pdf_path, stats)
+        return
+
+    stats["page_count"] = page_count
+    batch = max(1, page_count // (4 * workers))
+    starts = range(0, page_count, batch)
+    stops = [min(start + batch, page_count) for start in starts]
+    paths = [pdf_path] * len(starts)
+
+    # Callers may have threads running (capture copies the PDF on one; the MCP
+    # server and TUI have their own), and forking a threaded process can deadlock
+    spawn = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) as pool:
+        edges = [
+            edge for chunk in pool.map(_edge_lines_worker, paths, starts, stops) for edge in chunk
+        ]
+        headers, footers = _headers_footers_from_edges(edges)
+
+        rendered = pool.map(
+            _render_pages_worker,
+            paths,
+            starts,
+            stops,
+            [headers] * len(starts),
+            [footers] * len(starts),
+        )
+        for chunk in rendered:
+            for page_text, tables in chunk:
+                stats["table_count"] += tables
+                if page_text is not None:
+                    yield page_text
+
+
+def _extract_with_pypdf(pdf_path: Path, stats: dict) -> Iterator[str]:
     """Fallback extraction using pypdf (no table support)."""
     from pypdf import PdfReader
 
-    try:
-        reader = PdfReader(pdf_path)
-        text_parts = []
-        stats["page_count"] = len(reader.pages)
+    reader = PdfReader(pdf_path)
+    stats["page_count"] = len(reader.pages)
+
+    for page_num, page in enumerate(reader.pages, start=1):
+        text = page.extract_text()
+        if text and text.strip():
+            # Clean double spacing
+            cleaned = re.sub(r"  +", " ", text)
+            yield f"[Page {page_num}]\n{cleaned}"
+
+
+# ── Extraction cache ──
 
-        for page_num, page in enumerate(reader.pages, start=1):
-            text = page.extract_text()
-            if text and text.strip():
-                # Clean double spacing
-                cleaned = re.sub(r"  +", " ", text)
-                text_parts.append(f"[Page {page_num}]\n{cleaned}")
 
-        full_text = "\n\n".join(text_parts)
+def pdf_cache_enabled() -> bool:
+    """Check if the PDF text cache is enabled via SIFT_PDF_CACHE env var."""
+    return os.environ.get("SIFT_PDF_CACHE", "").lower() in ("1", "true", "yes")
 
-        if not full_text.strip():
-            raise ValueError("No text could be extracted from the PDF")
 
-        stats["char_count"] = len(full_text)
-        return full_text, stats
+def _pdf_digest(pdf_path: Path) -> str:
+    """Hash the PDF bytes (mmap'd, single update) to key the extraction cache."""
+    h = hashlib.blake2b(digest_size=20)
+    with open(pdf_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+    return h.hexdigest()
 
-    except Exception as e:
-        if "No text could be extracted" in str(e):
-            raise
+
+def _write_atomic(dest: Path, data: bytes) -> None:
+    with tempfile.NamedTemporaryFile("wb", dir=dest.parent, delete=False) as tf:
+        tf.write(data)
+        temp_name = tf.name
+    try:
+        os.replace(temp_name, dest)
+    except Exception:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
         raise
+
+
+def extract_text_from_pdf_cached(pdf_path: Path, cache_dir: Path) -> tuple[str, dict]:
+    """Like extract_text_from_pdf, but reuse earlier results for identical files.
+
+    Results are stored as ``{digest}-{engine}.txt`` plus a ``.json`` stats file in
+    cache_dir, so re-capturing the same document skips the parse entirely.
+    """
+    key = f"{_pdf_digest(pdf_path)}-{PDF_ENGINE}"
+    text_path = cache_dir / f"{key}.txt"
+    stats_path = cache_dir / f"{key}.json"
+
+    if text_path.exists() and stats_path.exists():
+        try:
+            return text_path.read_bytes().decode("utf-8"), json.loads(stats_path.read_bytes())
+        except (OSError, ValueError):
+            pass  # unreadable entry: fall through and re-extract
+
+    text, stats = extract_text_from_pdf(pdf_path)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _write_atomic(text_path, text.encode("utf-8"))
+    _write_atomic(stats_path, json.dumps(stats).encode("utf-8"))
+    return text, stats
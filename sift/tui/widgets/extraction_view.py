@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from itertools import islice
+
 from textual.widgets import DataTable
 
 
@@ -43,12 +45,11 @@ class ExtractionView(DataTable):
                 else:
                     display = "(none)"
             elif isinstance(value, dict):
-                display = "\n".join(f"{k}: {v}" for k, v in list(value.items())[:8])
+                display = "\n".join(f"{k}: {v}" for k, v in islice(value.items(), 8))
                 if len(value) > 8:
                     display += f"\n... and {len(value) - 8} more"
             else:
-                display = str(value)[:300]
-                if len(str(value)) > 300:
-                    display += "..."
+                text = str(value)
+                display = text[:300] + "..." if len(text) > 300 else text
 
             self.add_row(display_name, display, key=field_id)
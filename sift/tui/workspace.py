@@ -123,7 +123,7 @@ class WorkspaceScreen(Screen):
         if not phase_id or not self._session:
             return
 
-        pt = next((p for p in self._template.phases if p.id == phase_id), None)
+        pt = self._template.phases_by_id.get(phase_id)
         if not pt:
             return
 
@@ -2,10 +2,12 @@
 
 import json
 import sys
+from collections.abc import Sequence
 
 from rich.align import Align
 from rich.console import Console
 from rich.panel import Panel
+from rich.prompt import Prompt
 from rich.text import Text
 from rich.theme import Theme
 
@@ -263,3 +265,104 @@ def format_next_step(command: str):
         return
 
     console.print(f"\n  [bold]Next:[/bold] [cyan]{command}[/cyan]")
+
+
+def pdf_stats_panel(stats: dict, engine: str | None, subtitle: str) -> Panel:
+    """Build the "PDF Processed" summary panel from extraction stats."""
+    rows = (
+        ("Pages", str(stats["page_count"])),
+        ("Tables found", str(stats["table_count"])),
+        ("Characters", f"{stats['char_count']:,}"),
+        ("Engine", engine or "unknown"),
+    )
+    # Fixed two-column layout, so a preformatted string replaces a rich Table
+    body = "\n".join(
+        f"  [bold]{label:<12}[/bold]    [green]{value}[/green]" for label, value in rows
+    )
+    return Panel(
+        body,
+        title="[bold green]PDF Processed[/bold green]",
+        subtitle=subtitle,
+        border_style="green",
+    )
+
+
+# Non-terminal listings longer than this skip rich Table layout and print padded plain columns
+PLAIN_TABLE_MIN_ROWS = 200
+
+
+def print_plain_table(title: str, headers: tuple[str, ...], rows: Sequence[tuple[str, ...]]):
+    """Print rows as space-padded columns in a single write, without a rich Table.
+
+    Column widths are measured in one pass over the rows. Cells are printed
+    verbatim (no markup), so this suits long listings where Table's per-cell
+    measurement and wrapping would dominate.
+    """
+    from rich.cells import cell_len
+
+    widths = [cell_len(h) for h in headers]
+    measured = []
+    for row in rows:
+        lens = [cell_len(cell) for cell in row]
+        for i, n in enumerate(lens):
+            if n > widths[i]:
+                widths[i] = n
+        measured.append(lens)
+
+    def fmt(row, lens):
+        pads = (w - n for w, n in zip(widths, lens, strict=True))
+        return "  ".join(cell + " " * pad for cell, pad in zip(row, pads, strict=True)).rstrip()
+
+    lines = [title, fmt(headers, [cell_len(h) for h in headers])]
+    lines.append("  ".join("-" * w for w in widths))
+    lines.extend(fmt(row, lens) for row, lens in zip(rows, measured, strict=True))
+    console.print("\n".join(lines), markup=False, highlight=False, soft_wrap=True)
+
+
+class ChoicePrompt(Prompt):
+    """Prompt whose answer is validated against a frozenset of the choices.
+
+    Prompt.check_choice scans the choices list; numbered pickers can offer
+    hundreds of entries, so the membership test is made constant-time.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._choice_set = frozenset(self.choices) if self.choices is not None else None
+
+    def check_choice(self, value: str) -> bool:
+        if not self.case_sensitive or self._choice_set is None:
+            return super().check_choice(value)
+        return value.strip() in self._choice_set
+
+
+def read_until_end() -> str:
+    """Read multi-line text from stdin up to a line reading END, EOF, or Ctrl+C.
+
+    Only the lines up to END are consumed, so piped answers for later prompts
+    stay in stdin. A terminal is read with input() to keep line editing.
+    """
+    if sys.stdin.isatty():
+
+        def next_line() -> str | None:
+            try:
+                return input()
+            except EOFError:
+                return None
+
+    else:
+        readline = sys.stdin.readline
+
+        def next_line() -> str | None:
+            line = readline()
+            return line.removesuffix("\n") if line else None
+
+    lines = []
+    try:
+        while (line := next_line()) is not None:
+            if line.strip() == "END":
+                break
+            lines.append(line)
+    except KeyboardInterrupt:
+        console.print()
+    return "\n".join(lines)
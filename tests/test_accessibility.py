@@ -1,5 +1,6 @@
 """Tests for accessibility features: plain mode and JSON output."""
 
+import io
 import json
 
 import pytest
@@ -160,3 +161,55 @@ class TestJsonMode:
         ui.format_next_step("sift test")
         captured = capsys.readouterr()
         assert captured.out == ""
+
+
+class _FakeTty(io.StringIO):
+    def isatty(self):
+        return True
+
+
+class TestReadUntilEnd:
+    def test_piped_input_stops_at_end_line(self, monkeypatch):
+        stdin = io.StringIO("first\nsecond\n\n  END \nnext answer\n")
+        monkeypatch.setattr("sys.stdin", stdin)
+        assert ui.read_until_end() == "first\nsecond\n"
+        # Input after END is left for the prompts that follow
+        assert stdin.read() == "next answer\n"
+
+    def test_piped_input_without_end_reads_to_eof(self, monkeypatch):
+        monkeypatch.setattr("sys.stdin", io.StringIO("only line\n"))
+        assert ui.read_until_end() == "only line"
+
+    def test_terminal_input_stops_at_end_line(self, monkeypatch):
+        stdin = _FakeTty("a\nb\nEND\nc\n")
+        monkeypatch.setattr("sys.stdin", stdin)
+        assert ui.read_until_end() == "a\nb"
+        assert stdin.read() == "c\n"
+
+
+class TestPlainTable:
+    def test_columns_padded_to_widest_cell(self, capsys):
+        ui.print_plain_table(
+            "Sessions",
+            ("Name", "Status"),
+            [("a-long-session-name", "active"), ("b", "[x] done")],
+        )
+        lines = capsys.readouterr().out.splitlines()
+
+        assert lines[0] == "Sessions"
+        assert lines[1] == "Name                 Status"
+        assert lines[3] == "a-long-session-name  active"
+        # Cells are printed verbatim, never parsed as markup
+        assert lines[4] == "b                    [x] done"
+
+
+class TestChoicePrompt:
+    def test_validates_against_choices(self):
+        prompt = ui.ChoicePrompt("Pick", choices=[str(i) for i in range(1, 501)])
+        assert prompt.check_choice(" 250 ")
+        assert not prompt.check_choice("501")
+
+    def test_case_insensitive_falls_back_to_rich(self):
+        prompt = ui.ChoicePrompt("Pick", choices=["Yes", "No"], case_sensitive=False)
+        assert prompt.check_choice("yes")
+        assert prompt.process_response("no") == "No"
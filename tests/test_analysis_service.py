@@ -153,6 +153,36 @@ class TestSerializeAnalysisText:
         assert "Complexity Hotspots" in text
         assert "complexity=4.5" in text
 
+    def test_hotspots_are_top_ten_by_score_in_stable_order(self, tmp_path):
+        scores = [3.0, 0.0, 5.0, 1.0, 5.0, 2.0, 4.0, 1.0, 6.0, 2.0, 0.5, 3.0, 1.0]
+        structure = ProjectStructure(
+            root_path=tmp_path,
+            name="hot",
+            file_analyses=[
+                FileAnalysis(
+                    path=tmp_path / f"f{i}.py", language="python", line_count=1, complexity_score=c
+                )
+                for i, c in enumerate(scores)
+            ],
+        )
+        text = serialize_analysis_text(structure)
+        listed = [
+            line.split(":")[0][2:]
+            for line in text.split("## Complexity Hotspots\n")[1].splitlines()
+        ]
+        assert listed == [
+            "f8.py",
+            "f2.py",
+            "f4.py",
+            "f6.py",
+            "f0.py",
+            "f11.py",
+            "f5.py",
+            "f9.py",
+            "f3.py",
+            "f7.py",
+        ]
+
     def test_handles_empty_structure(self, tmp_path):
         structure = ProjectStructure(root_path=tmp_path, name="empty")
         text = serialize_analysis_text(structure)
@@ -215,6 +245,21 @@ class TestCaptureAnalysis:
             ctx = yaml.safe_load(f)
         assert ctx["project_name"] == "test-project"
 
+    def test_builds_analysis_view_once(self, sample_session, sample_project):
+        from unittest.mock import patch
+
+        from sift.core import analysis_service
+
+        svc = AnalysisService()
+        with patch.object(
+            analysis_service, "_analysis_view", wraps=analysis_service._analysis_view
+        ) as view:
+            svc.capture_analysis("test-session", "gather-info", sample_project)
+
+        assert view.call_count == 1
+        ctx = svc.get_analysis_context("test-session")
+        assert [d["name"] for d in ctx["dependencies"]] == ["flask"]
+
     def test_append_mode(self, sample_session, sample_project):
         svc = AnalysisService()
         from sift.core.extraction_service import ExtractionService
@@ -271,6 +316,71 @@ class TestPopulateMatchingPhases:
         # "action-items" should NOT be auto-populated (no matching keywords)
         assert "action-items" not in populated
 
+    def test_builds_each_text_once(self, sift_home, sample_project):
+        from unittest.mock import patch
+
+        from sift.core.session_service import SessionService
+
+        phases = [
+            {"id": pid, "name": name, "prompt": "p", "capture": [{"type": "text"}]}
+            for pid, name in [
+                ("architecture", "Architecture"),
+                ("design", "Design"),
+                ("packages", "Packages"),
+                ("dependency-audit", "Dependency Audit"),
+            ]
+        ]
+        path = sift_home / "templates" / "repeat.yaml"
+        path.write_text(yaml.dump({"name": "Repeat", "phases": phases}))
+        SessionService().create_session("repeat", name="repeat-test")
+
+        analysis_svc = AnalysisService()
+        structure = ProjectStructure(
+            root_path=sample_project,
+            name="test-project",
+            dependencies=[DependencyInfo(name="flask")],
+        )
+        with (
+            patch(
+                "sift.core.analysis_service.serialize_analysis_text", return_value="a"
+            ) as analysis_text,
+            patch.object(
+                analysis_svc, "_build_dependency_text", return_value="d"
+            ) as dependency_text,
+        ):
+            populated = analysis_svc._populate_matching_phases("repeat-test", structure)
+
+        assert len(populated) == 4
+        assert analysis_text.call_count == 1
+        assert dependency_text.call_count == 1
+
+    def test_category_requires_matching_data(self, sift_home, sample_project):
+        from sift.core.session_service import SessionService
+
+        phases = [
+            {"id": pid, "name": name, "prompt": "p", "capture": [{"type": "text"}]}
+            for pid, name in [("architecture", "Architecture"), ("dep_review", "Dependency Review")]
+        ]
+        path = sift_home / "templates" / "fallthrough.yaml"
+        path.write_text(yaml.dump({"name": "Fallthrough", "phases": phases}))
+        svc = SessionService()
+        svc.create_session("fallthrough", name="no-deps")
+        svc.create_session("fallthrough", name="with-deps")
+
+        analysis_svc = AnalysisService()
+        bare = ProjectStructure(root_path=sample_project, name="test-project")
+        assert analysis_svc._populate_matching_phases("no-deps", bare) == ["architecture"]
+
+        with_deps = ProjectStructure(
+            root_path=sample_project,
+            name="test-project",
+            dependencies=[DependencyInfo(name="flask")],
+        )
+        populated = analysis_svc._populate_matching_phases("with-deps", with_deps)
+        assert populated == ["architecture", "dep_review"]
+        transcript = Session.load("with-deps").get_transcript("dep_review")
+        assert transcript.startswith("# Dependency Audit")
+
     def test_skips_non_pending_phases(self, analysis_template_path, sample_project):
         from sift.core.extraction_service import ExtractionService
         from sift.core.session_service import SessionService
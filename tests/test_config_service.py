@@ -508,3 +508,34 @@ class TestConfigIntegration:
 
         assert Config.get_ai_provider() == "gemini"
         reset_config_service()
+
+    def test_set_global_invalidates_cached_provider(self, tmp_path, monkeypatch):
+        from sift.config import Config
+
+        config_path = tmp_path / "config.toml"
+        monkeypatch.setattr("sift.core.config_service._global_config_path", lambda: config_path)
+        monkeypatch.setattr(
+            "sift.core.config_service._project_config_path",
+            lambda: tmp_path / "nonexistent.toml",
+        )
+        monkeypatch.delenv("AI_PROVIDER", raising=False)
+        monkeypatch.delenv("SIFT_PROVIDER", raising=False)
+        reset_config_service()
+        _write_toml({"providers": {"default": "anthropic"}}, config_path)
+        assert Config.get_ai_provider() == "anthropic"
+
+        get_config_service().set_global("providers.default", "gemini")
+        assert Config.get_ai_provider() == "gemini"
+
+    def test_store_key_invalidates_cached_key(self, tmp_path, monkeypatch):
+        cred_path = tmp_path / "credentials"
+        monkeypatch.setattr("sift.core.secrets._credentials_path", lambda: cred_path)
+        monkeypatch.setattr("sift.core.secrets._store_keyring", lambda p, k: False)
+        monkeypatch.setattr("sift.core.secrets._get_keyring", lambda p: None)
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+        from sift.config import Config
+
+        assert Config.get_anthropic_api_key() is None
+        store_key("anthropic", "sk-new")
+        assert Config.get_anthropic_api_key() == "sk-new"
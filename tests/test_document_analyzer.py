@@ -0,0 +1,39 @@
+"""Tests for the keyword-based multi-phase heuristic."""
+
+import pytest
+
+import sift.document_analyzer as analyzer
+
+COVERS_BOTH = (
+    "Gathering information: the key points and a summary of the main topic. "
+    "Review and validate: issues found, gaps, and whether it is approved. "
+) * 20
+
+
+@pytest.fixture(params=["automaton", "substring"])
+def matcher(request, monkeypatch):
+    if request.param == "automaton":
+        if analyzer.ahocorasick is None:
+            pytest.skip("pyahocorasick not installed")
+    else:
+        monkeypatch.setattr(analyzer, "ahocorasick", None)
+    return request.param
+
+
+class TestDetectMultiPhase:
+    def test_detects_document_covering_two_phases(self, sample_template, matcher):
+        assert analyzer.detect_multi_phase_content(COVERS_BOTH, sample_template.phases)
+
+    def test_single_phase_document(self, sample_template, matcher):
+        text = "The key points and a summary of the main topic. " * 60
+        assert not analyzer.detect_multi_phase_content(text, sample_template.phases)
+
+    def test_short_documents_are_skipped(self, sample_template, matcher):
+        text = COVERS_BOTH[: analyzer.MIN_MULTI_PHASE_CHARS - 1]
+        assert not analyzer.detect_multi_phase_content(text, sample_template.phases)
+
+    def test_incremental_feed_matches_whole_text(self, sample_template, matcher):
+        detector = analyzer.MultiPhaseDetector(sample_template.phases)
+        for page in COVERS_BOTH.split(". "):
+            detector.feed(page + ". ")
+        assert detector.is_multi_phase()
@@ -39,6 +39,35 @@ class TestCaptureText:
         with pytest.raises(SessionNotFoundError):
             svc.capture_text("nonexistent", "phase", "test")
 
+    def test_on_existing_not_called_for_pending_phase(self, sample_session):
+        svc = ExtractionService()
+        calls = []
+        result = svc.capture_text(
+            "test-session", "gather-info", "Hello", on_existing=lambda: calls.append(1)
+        )
+        assert calls == []
+        assert result.had_content is False
+
+    def test_on_existing_append(self, sample_session):
+        svc = ExtractionService()
+        svc.capture_text("test-session", "gather-info", "First")
+        result = svc.capture_text(
+            "test-session", "gather-info", "Second", on_existing=lambda: "append"
+        )
+        assert result.had_content is True
+        assert result.appended is True
+        transcript = Session.load("test-session").get_transcript("gather-info")
+        assert "First" in transcript and "Second" in transcript
+
+    def test_on_existing_cancel(self, sample_session):
+        svc = ExtractionService()
+        svc.capture_text("test-session", "gather-info", "First")
+        result = svc.capture_text(
+            "test-session", "gather-info", "Second", on_existing=lambda: "cancel"
+        )
+        assert result.cancelled is True
+        assert Session.load("test-session").get_transcript("gather-info") == "First"
+
 
 class TestCaptureFile:
     def test_capture_text_file(self, sample_session, tmp_path):
@@ -61,6 +90,20 @@ class TestCaptureFile:
         assert result.status == "captured"
         assert result.file_type == "audio"
 
+    def test_recapture_audio_does_not_touch_earlier_upload(self, sample_session, tmp_path):
+        first = tmp_path / "first.mp3"
+        first.write_bytes(b"first")
+        second = tmp_path / "second.mp3"
+        second.write_bytes(b"second")
+
+        svc = ExtractionService()
+        svc.capture_file("test-session", "gather-info", first)
+        svc.capture_file("test-session", "gather-info", second)
+
+        dest = sample_session.phase_dir("gather-info") / "audio.mp3"
+        assert dest.read_bytes() == b"second"
+        assert first.read_bytes() == b"first"
+
     def test_capture_unsupported_file(self, sample_session, tmp_path):
         bad_file = tmp_path / "data.xlsx"
         bad_file.write_bytes(b"\x00")
@@ -74,6 +117,22 @@ class TestCaptureFile:
         with pytest.raises(CaptureError):
             svc.capture_file("test-session", "gather-info", tmp_path / "nope.txt")
 
+    def test_failed_pdf_capture_leaves_phase_untouched(self, sample_session, tmp_path):
+        import sift.pdf
+
+        if not sift.pdf.PDF_AVAILABLE:
+            pytest.skip("PDF support not installed")
+
+        bad_pdf = tmp_path / "broken.pdf"
+        bad_pdf.write_bytes(b"not a pdf at all")
+
+        svc = ExtractionService()
+        with pytest.raises(ValueError):
+            svc.capture_file("test-session", "gather-info", bad_pdf)
+
+        assert list(sample_session.phase_dir("gather-info").iterdir()) == []
+        assert Session.load("test-session").phases["gather-info"].status == "pending"
+
 
 class TestExtractPhase:
     def test_extract_with_mock_provider(self, sample_session, mock_provider):
@@ -137,6 +196,60 @@ class TestExtractPhase:
         s = Session.load("ne-test")
         assert s.phases["simple"].status == "complete"
 
+    def test_prior_phase_context_is_reused_until_changed(self, sample_session, mock_provider):
+        svc = ExtractionService()
+        svc.capture_text("test-session", "gather-info", "We discussed points A, B, and C.")
+        with patch("sift.engine.get_provider", return_value=mock_provider):
+            svc.extract_phase("test-session", "gather-info")
+
+        s = Session.load("test-session")
+        tmpl = s.get_template()
+        first = svc._gather_context(s, tmpl, "review")
+        assert first.startswith("Data from 'Gather Information':\n")
+        assert "Point 1" in first
+
+        with patch("sift.core.extraction_service.yaml.load") as load:
+            assert svc._gather_context(s, tmpl, "review") == first
+        load.assert_not_called()
+
+        (s.phase_dir("gather-info") / "extracted.yaml").write_text("summary: Revised\n")
+        assert "Revised" in svc._gather_context(s, tmpl, "review")
+
+    def test_context_cache_sees_replaced_file_with_same_mtime(self, sample_session):
+        import os
+
+        svc = ExtractionService()
+        s = Session.load("test-session")
+        tmpl = s.get_template()
+        dest = s.write_extracted("gather-info", {"summary": "First"})
+        s.phases["gather-info"].extracted_file = dest.name
+        assert "First" in svc._gather_context(s, tmpl, "review")
+
+        st = dest.stat()
+        s.write_extracted("gather-info", {"summary": "Other"})
+        os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert "Other" in svc._gather_context(s, tmpl, "review")
+
+    def test_context_sections_are_blank_line_separated(self, sample_session):
+        from types import SimpleNamespace
+
+        svc = ExtractionService()
+        tmpl = SimpleNamespace(
+            phases=[
+                SimpleNamespace(id="a", name="A"),
+                SimpleNamespace(id="b", name="B"),
+                SimpleNamespace(id="c", name="C"),
+                SimpleNamespace(id="d", name="D"),
+            ]
+        )
+        dumps = {"a": "x: 1\n", "b": None, "c": "y: 2\n"}
+        with patch.object(svc, "_phase_context_yaml", side_effect=lambda s, pid: dumps[pid]):
+            context = svc._gather_context(sample_session, tmpl, "d")
+
+        assert context == "Data from 'A':\nx: 1\n\n\nData from 'C':\ny: 2\n"
+        with patch.object(svc, "_phase_context_yaml", return_value=None):
+            assert svc._gather_context(sample_session, tmpl, "d") == ""
+
 
 class TestGetRemainingPhases:
     def test_all_pending(self, sample_session):
@@ -106,6 +106,20 @@ class TestMigrationService:
         assert result.name == "test-session"
         assert "Already at current version" in result.changes
 
+    def test_changes_joined(self):
+        """changes_joined renders the change list as one display line."""
+        from sift.core.migration_service import MigrationResult
+
+        result = MigrationResult(
+            name="s",
+            source_version=1,
+            target_version=3,
+            migrated=True,
+            changes=["Migrated v1 -> v2", "Migrated v2 -> v3"],
+        )
+
+        assert result.changes_joined == "Migrated v1 -> v2; Migrated v2 -> v3"
+
     def test_migrate_session_dry_run(self, sample_session):
         """Dry run should not modify files."""
         from sift.core.migration_service import MigrationService
@@ -0,0 +1,142 @@
+"""Tests for PDF extraction helpers."""
+
+import io
+
+import pytest
+
+import sift.pdf as pdf
+
+
+class TestPdfCache:
+    def test_cache_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("SIFT_PDF_CACHE", raising=False)
+        assert pdf.pdf_cache_enabled() is False
+
+        monkeypatch.setenv("SIFT_PDF_CACHE", "1")
+        assert pdf.pdf_cache_enabled() is True
+
+    def test_cached_extraction_reuses_result(self, tmp_path, monkeypatch):
+        source = tmp_path / "doc.pdf"
+        source.write_bytes(b"%PDF-1.4 fake")
+        calls = []
+
+        def fake_extract(path):
+            calls.append(path)
+            return "[Page 1]\nHello", {"page_count": 1, "table_count": 0, "char_count": 15}
+
+        monkeypatch.setattr(pdf, "extract_text_from_pdf", fake_extract)
+        cache_dir = tmp_path / "cache"
+
+        first = pdf.extract_text_from_pdf_cached(source, cache_dir)
+        second = pdf.extract_text_from_pdf_cached(source, cache_dir)
+
+        assert first == second
+        assert second[1]["page_count"] == 1
+        assert len(calls) == 1
+
+    def test_changed_file_misses_cache(self, tmp_path, monkeypatch):
+        source = tmp_path / "doc.pdf"
+        source.write_bytes(b"%PDF-1.4 one")
+        monkeypatch.setattr(
+            pdf, "extract_text_from_pdf", lambda p: (p.read_text(), {"page_count": 1})
+        )
+        cache_dir = tmp_path / "cache"
+
+        assert pdf.extract_text_from_pdf_cached(source, cache_dir)[0] == "%PDF-1.4 one"
+        source.write_bytes(b"%PDF-1.4 two")
+        assert pdf.extract_text_from_pdf_cached(source, cache_dir)[0] == "%PDF-1.4 two"
+
+
+class TestStreamingExtraction:
+    PAGES = ["[Page 1]\nIntro", "[Page 3]\nDetails"]
+
+    def _fake_pages(self, monkeypatch, pages):
+        def fake_iter(path, stats):
+            stats["page_count"] = 3
+            yield from pages
+
+        monkeypatch.setattr(pdf, "PDF_AVAILABLE", True)
+        monkeypatch.setattr(pdf, "_iter_pages", fake_iter)
+
+    def test_matches_in_memory_extraction(self, tmp_path, monkeypatch):
+        source = tmp_path / "doc.pdf"
+        source.write_bytes(b"%PDF-1.4 fake")
+        self._fake_pages(monkeypatch, self.PAGES)
+        out = io.StringIO()
+        seen = []
+
+        stats = pdf.extract_text_from_pdf_to_file(source, out, prefix="old\n", on_page=seen.append)
+
+        text, expected = pdf.extract_text_from_pdf(source)
+        assert out.getvalue() == "old\n" + text
+        assert stats == expected
+        assert seen == self.PAGES
+
+    def test_empty_pdf_writes_nothing(self, tmp_path, monkeypatch):
+        source = tmp_path / "doc.pdf"
+        source.write_bytes(b"%PDF-1.4 fake")
+        self._fake_pages(monkeypatch, [])
+        out = io.StringIO()
+
+        with pytest.raises(ValueError, match="No text"):
+            pdf.extract_text_from_pdf_to_file(source, out, prefix="old\n")
+        assert out.getvalue() == ""
+
+
+def _write_text_pdf(path, pages):
+    """Write a minimal PDF with one line of Helvetica text per page."""
+    count = len(pages)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids ["
+        + b" ".join(b"%d 0 R" % (4 + 2 * i) for i in range(count))
+        + b"] /Count %d >>" % count,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(pages):
+        stream = b"BT /F1 12 Tf 72 720 Td (%s) Tj ET" % text.encode("latin-1")
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    path.write_bytes(bytes(out))
+
+
+@pytest.mark.skipif(pdf.PDF_ENGINE != "pdfplumber", reason="pdfplumber not installed")
+class TestParallelExtraction:
+    def test_matches_sequential_output(self, tmp_path):
+        source = tmp_path / "doc.pdf"
+        _write_text_pdf(source, [f"Section {n} notes" for n in range(1, 11)])
+
+        sequential = {"page_count": 0, "table_count": 0}
+        parallel = {"page_count": 0, "table_count": 0}
+        expected = list(pdf._extract_with_pdfplumber(source, sequential))
+        pages = list(pdf._extract_with_pdfplumber_parallel(source, parallel, workers=2))
+
+        assert pages == expected
+        assert pages[0] == "[Page 1]\nSection 1 notes"
+        assert parallel == sequential == {"page_count": 10, "table_count": 0}
+
+    def test_small_files_skip_the_pool(self, tmp_path, monkeypatch):
+        source = tmp_path / "doc.pdf"
+        _write_text_pdf(source, ["Only page"])
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool used for a small PDF")
+
+        monkeypatch.setattr(pdf, "_extract_with_pdfplumber_parallel", no_pool)
+        assert pdf.extract_text_from_pdf(source)[0] == "[Page 1]\nOnly page"
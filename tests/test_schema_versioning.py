@@ -84,3 +84,26 @@ class TestTemplateSchemaVersion:
 
         t = SessionTemplate.from_file(sample_template_path)
         assert t.name == "Test Template"
+
+
+class TestTemplateFileCache:
+    def test_unchanged_file_is_parsed_once(self, sample_template_path, monkeypatch):
+        first = SessionTemplate.from_file(sample_template_path)
+
+        def fail(path):
+            raise AssertionError("template was re-parsed")
+
+        monkeypatch.setattr(SessionTemplate, "_parse_file", classmethod(lambda cls, p: fail(p)))
+        assert SessionTemplate.from_file(sample_template_path) is first
+
+    def test_rewritten_file_is_reloaded(self, sample_template_path):
+        first = SessionTemplate.from_file(sample_template_path)
+        with open(sample_template_path) as f:
+            data = yaml.safe_load(f)
+        data["name"] = "Renamed Template"
+        with open(sample_template_path, "w") as f:
+            yaml.dump(data, f)
+
+        second = SessionTemplate.from_file(sample_template_path)
+        assert second is not first
+        assert second.name == "Renamed Template"
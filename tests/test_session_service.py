@@ -83,6 +83,24 @@ class TestSessionServiceList:
         assert info.done_phases == 0
         assert info.status == "active"
 
+    def test_list_sessions_sees_saved_progress(self, sample_session):
+        svc = SessionService()
+        assert svc.list_sessions()[0].in_progress_phases == 0
+
+        sample_session.phases["gather-info"].status = "captured"
+        sample_session.phases["review"].status = "extracted"
+        sample_session.save()
+
+        info = svc.list_sessions()[0]
+        assert info.in_progress_phases == 1
+        assert info.done_phases == 1
+
+    def test_list_sessions_skips_dirs_without_session_yaml(self, sample_session, sift_home):
+        (sift_home / "sessions" / "stray-dir").mkdir()
+        (sift_home / "sessions" / "stray-file.txt").write_text("x")
+
+        assert [s.name for s in SessionService().list_sessions()] == ["test-session"]
+
 
 class TestSessionServiceStatus:
     def test_get_status(self, sample_session):
@@ -106,6 +124,24 @@ class TestSessionServiceStatus:
         assert detail.next_action == "capture"
         assert detail.next_action_phase == "gather-info"
 
+    def test_next_action_prefers_later_pipeline_steps(self, sample_session):
+        sample_session.phases["gather-info"].status = "captured"
+        sample_session.phases["review"].status = "transcribed"
+        sample_session.save()
+
+        detail = SessionService().get_session_status("test-session")
+        assert detail.next_action == "extract"
+        assert detail.next_action_phase == "review"
+
+    def test_next_action_is_build_when_all_done(self, sample_session):
+        for ps in sample_session.phases.values():
+            ps.status = "extracted"
+        sample_session.save()
+
+        detail = SessionService().get_session_status("test-session")
+        assert detail.next_action == "build"
+        assert detail.next_action_phase is None
+
 
 class TestSessionServiceExport:
     def test_export_session(self, sample_session, tmp_path):
@@ -118,6 +154,23 @@ class TestSessionServiceExport:
         assert result.output_path is not None
         assert result.output_path.exists()
 
+    def test_export_pairs_phase_files_with_their_phase(self, sample_session):
+        for phase_id in ("gather-info", "review"):
+            phase_dir = sample_session.phase_dir(phase_id)
+            (phase_dir / "transcript.txt").write_text(f"notes for {phase_id}")
+            (phase_dir / "extracted.yaml").write_text(f"summary: {phase_id}\n")
+            ps = sample_session.phases[phase_id]
+            ps.transcript_file = "transcript.txt"
+            ps.extracted_file = "extracted.yaml"
+        sample_session.phases["review"].transcript_file = None
+        sample_session.save()
+
+        phases = SessionService().export_session("test-session").data["phases"]
+        assert phases["gather-info"]["transcript"] == "notes for gather-info"
+        assert phases["gather-info"]["extracted"] == {"summary": "gather-info"}
+        assert "transcript" not in phases["review"]
+        assert phases["review"]["extracted"] == {"summary": "review"}
+
     def test_export_session_no_output_dir(self, sample_session):
         svc = SessionService()
         result = svc.export_session("test-session")
@@ -152,3 +205,69 @@ class TestSessionServiceCompletions:
         svc = SessionService()
         ids = svc.get_phase_ids("nonexistent")
         assert ids == []
+
+
+class TestSessionTransaction:
+    def test_saves_are_deferred_until_exit(self, sample_session):
+        from sift.models import Session
+
+        with sample_session.transaction():
+            sample_session.phases["gather-info"].status = "transcribed"
+            sample_session.save()
+            with sample_session.transaction():
+                sample_session.phases["review"].status = "transcribed"
+                sample_session.save()
+            assert Session.load("test-session").phases["gather-info"].status == "pending"
+
+        reloaded = Session.load("test-session")
+        assert reloaded.phases["gather-info"].status == "transcribed"
+        assert reloaded.phases["review"].status == "transcribed"
+
+    def test_pending_changes_written_on_error(self, sample_session):
+        from sift.models import Session
+
+        with pytest.raises(RuntimeError), sample_session.transaction():
+            sample_session.phases["review"].status = "captured"
+            sample_session.save()
+            raise RuntimeError("boom")
+
+        assert Session.load("test-session").phases["review"].status == "captured"
+
+
+class TestSessionArtifacts:
+    def test_load_all_artifacts_keeps_order_and_skips_empty(self, sample_session, mock_provider):
+        from unittest.mock import patch
+
+        from sift.core.extraction_service import ExtractionService
+        from sift.models import Session
+
+        ext = ExtractionService()
+        ext.capture_text("test-session", "gather-info", "We discussed A, B, and C.")
+        with patch("sift.engine.get_provider", return_value=mock_provider):
+            ext.extract_phase("test-session", "gather-info")
+        ext.capture_text("test-session", "review", "Checked everything.")
+        s = Session.load("test-session")
+        extracted, transcripts = s.load_all_artifacts(["review", "gather-info", "missing"])
+
+        assert list(extracted) == ["gather-info"]
+        assert list(transcripts) == ["review", "gather-info"]
+        assert transcripts["review"] == "Checked everything."
+
+    def test_write_extracted_round_trips_without_leaving_temp_files(self, sample_session):
+        from sift.models import Session
+
+        session = Session.load("test-session")
+        dest = session.write_extracted("gather-info", {"summary": "caf\u00e9", "key_points": []})
+        assert dest.name == "extracted.yaml"
+        assert list(dest.parent.glob("*.tmp")) == []
+        session.phases["gather-info"].extracted_file = dest.name
+        assert session.get_extracted("gather-info") == {"summary": "caf\u00e9", "key_points": []}
+
+    def test_transcript_preview_is_bounded(self, sample_session):
+        from sift.core.extraction_service import ExtractionService
+        from sift.models import Session
+
+        ExtractionService().capture_text("test-session", "gather-info", "x" * 5000)
+        session = Session.load("test-session")
+        assert session.get_transcript("gather-info", max_chars=800) == "x" * 801
+        assert session.get_transcript("gather-info", max_chars=10000) == "x" * 5000
@@ -0,0 +1,61 @@
+"""Tests for TemplateService."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from sift.core.template_service import TemplateService
+from sift.errors import TemplateNotFoundError
+
+
+class TestFindTemplate:
+    def test_repeat_lookup_skips_filesystem_probes(self, sample_template_path, monkeypatch):
+        svc = TemplateService()
+        assert svc.find_template("test-template") == sample_template_path
+
+        def no_probe(self):
+            raise AssertionError("path was probed again")
+
+        monkeypatch.setattr(Path, "exists", no_probe)
+        assert svc.find_template("test-template") == sample_template_path
+
+    def test_removed_template_is_not_returned(self, sample_template_path):
+        svc = TemplateService()
+        svc.find_template("test-template")
+        sample_template_path.unlink()
+        # Make sure the dir mtime moves even on filesystems with coarse timestamps
+        st = os.stat(sample_template_path.parent)
+        os.utime(sample_template_path.parent, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        with pytest.raises(TemplateNotFoundError):
+            svc.find_template("test-template")
+
+    def test_yml_added_later_is_found(self, sample_template_path):
+        svc = TemplateService()
+        with pytest.raises(TemplateNotFoundError):
+            svc.find_template("other")
+
+        (sample_template_path.parent / "other.yml").write_text(sample_template_path.read_text())
+        assert svc.find_template("other").name == "other.yml"
+
+
+class TestImportTemplate:
+    def test_imported_template_is_not_parsed_again(
+        self, sample_template_path, tmp_path, monkeypatch
+    ):
+        from sift.models import SessionTemplate
+
+        src = tmp_path / "imported.yaml"
+        src.write_text(sample_template_path.read_text())
+        svc = TemplateService()
+        info = svc.import_template(src)
+        assert info.stem == "imported"
+
+        monkeypatch.setattr(
+            SessionTemplate,
+            "_parse_file",
+            classmethod(lambda cls, p: pytest.fail(f"{p} was re-parsed")),
+        )
+        dest = sample_template_path.parent / "imported.yaml"
+        assert SessionTemplate.from_file(dest).name == "Test Template"